@@ -0,0 +1,29 @@
+# SPDX-FileCopyrightText: (c) 2025 Tenstorrent AI ULC
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+JSON helpers shared by the memory profiler modules.
+
+orjson is used when the optional "fast" dependency is installed; it encodes
+and decodes several times faster than the stdlib json module, which is the
+fallback otherwise.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def load_json(path: Union[str, Path]) -> Any:
+    """Load a JSON file, with orjson when it is available."""
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
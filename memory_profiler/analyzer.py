@@ -16,9 +16,33 @@ including:
 TODO: Implement analysis functions as needed.
 """
 
-import json
+import statistics
 from typing import Dict, List, Tuple
 
+# Handle both package import and direct execution
+try:
+    from ._json_compat import load_json
+except ImportError:
+    from _json_compat import load_json
+
+
+def _load_mem_data(mem_file: str) -> List[Dict]:
+    """
+    Load the per-operation memory statistics list from a JSON file.
+
+    Args:
+        mem_file: Path to memory statistics JSON
+
+    Returns:
+        List of per-operation memory statistics
+    """
+    mem_json = load_json(mem_file)
+
+    # Handle both old format (list) and new format (dict with metadata)
+    if isinstance(mem_json, dict) and "operations" in mem_json:
+        return mem_json["operations"]
+    return mem_json
+
 
 def find_peak_memory(
     mem_file: str, memory_type: str = "DRAM"
@@ -33,17 +57,15 @@ def find_peak_memory(
     Returns:
         Tuple of (index, peak_value, operation_info)
     """
-    with open(mem_file, "r") as f:
-        mem_data = json.load(f)
+    mem_data = _load_mem_data(mem_file)
 
     peak_idx = -1
     peak_val = 0.0
 
     for i, op in enumerate(mem_data):
-        if memory_type in op["memory"]:
-            allocated = op["memory"][memory_type].get(
-                "totalBytesAllocatedPerBank_MB", 0.0
-            )
+        stats = op["memory"].get(memory_type)
+        if stats is not None:
+            allocated = stats.get("totalBytesAllocatedPerBank_MB", 0.0)
             if allocated > peak_val:
                 peak_val = allocated
                 peak_idx = i
@@ -57,6 +79,9 @@ def compute_memory_statistics(mem_file: str, memory_type: str = "DRAM") -> Dict:
     """
     Compute basic statistics for memory usage across all operations.
 
+    Operations without allocation data for memory_type are left out rather
+    than counted as 0 MB.
+
     Args:
         mem_file: Path to memory statistics JSON
         memory_type: Type of memory to analyze
@@ -64,8 +89,21 @@ def compute_memory_statistics(mem_file: str, memory_type: str = "DRAM") -> Dict:
     Returns:
         Dictionary with min, max, mean, median statistics
     """
-    # TODO: Implement statistical analysis
-    pass
+    allocated = []
+    for op in _load_mem_data(mem_file):
+        stats = op["memory"].get(memory_type)
+        if stats is not None and "totalBytesAllocatedPerBank_MB" in stats:
+            allocated.append(stats["totalBytesAllocatedPerBank_MB"])
+
+    if not allocated:
+        return {"min": 0.0, "max": 0.0, "mean": 0.0, "median": 0.0}
+
+    return {
+        "min": min(allocated),
+        "max": max(allocated),
+        "mean": statistics.fmean(allocated),
+        "median": statistics.median(allocated),
+    }
 
 
 def detect_memory_leaks(mem_file: str) -> List[Dict]:
@@ -16,9 +16,16 @@ Example:
     python extract_last_run.py logs/decoder_20260122_153451/decoder_profile.log
 """
 
+import mmap
+import os
+import shutil
 import sys
+import tempfile
 from pathlib import Path
 
+# Chunk size used when copying the kept tail of the log
+COPY_CHUNK_SIZE = 1 << 20
+
 
 def extract_last_run(log_file_path: Path) -> None:
     """
@@ -31,42 +38,45 @@ def extract_last_run(log_file_path: Path) -> None:
 
     print(f"Processing: {log_file_path}")
 
-    # Read the entire log file
-    with open(log_file_path, "r") as f:
-        lines = f.readlines()
-
-    print(f"Total lines in log: {len(lines)}")
-
-    # Find all occurrences of "Got output shape:"
-    marker = "Got output shape:"
-    marker_indices = []
-
-    for i, line in enumerate(lines):
-        if marker in line:
-            marker_indices.append(i)
-
-    if not marker_indices:
-        print(f"Warning: No '{marker}' found in log file. Keeping entire log.")
-        return
-
-    print(f"Found {len(marker_indices)} occurrence(s) of '{marker}'")
-
-    # Get the first occurrence
-    first_marker_index = marker_indices[0]
-    print(f"First occurrence at line {first_marker_index + 1}")
-
-    # Keep everything after the first marker (excluding the marker line itself)
-    lines_to_keep = lines[first_marker_index + 1 :]
-    print(f"Keeping {len(lines_to_keep)} lines from after first occurrence")
-
-    # Write back to the same file
-    with open(log_file_path, "w") as f:
-        f.writelines(lines_to_keep)
-
-    print(f"\n✓ Successfully extracted content after first '{marker}'")
-    print(
-        f"✓ Removed {len(lines) - len(lines_to_keep)} lines (warmup + first run marker)"
-    )
+    marker = b"Got output shape:"
+
+    with open(log_file_path, "rb") as src:
+        total_bytes = os.fstat(src.fileno()).st_size
+        print(f"Total size of log: {total_bytes} bytes")
+
+        # Locate the first marker with a C-level search over the mapped file
+        # instead of materializing every line as a Python string
+        if total_bytes == 0:
+            marker_offset = -1
+        else:
+            with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                marker_offset = mm.find(marker)
+                if marker_offset >= 0:
+                    newline = mm.find(b"\n", marker_offset)
+                    # Keep everything after the marker line itself
+                    cut_offset = total_bytes if newline < 0 else newline + 1
+
+        if marker_offset < 0:
+            print(
+                f"Warning: No '{marker.decode()}' found in log file. Keeping entire log."
+            )
+            return
+
+        print(f"First occurrence at byte offset {marker_offset}")
+        print(f"Keeping {total_bytes - cut_offset} bytes from after first occurrence")
+
+        # Copy the tail to a temp file next to the log, then swap it in atomically
+        src.seek(cut_offset)
+        with tempfile.NamedTemporaryFile(
+            dir=log_file_path.parent, delete=False
+        ) as tmp:
+            shutil.copyfileobj(src, tmp, COPY_CHUNK_SIZE)
+
+    shutil.copymode(log_file_path, tmp.name)
+    os.replace(tmp.name, log_file_path)
+
+    print(f"\n✓ Successfully extracted content after first '{marker.decode()}'")
+    print(f"✓ Removed {cut_offset} bytes (warmup + first run marker)")
     print(f"✓ Updated: {log_file_path}")
 
 
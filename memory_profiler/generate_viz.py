@@ -45,12 +45,11 @@ def main():
             print("Error: No logs directory found")
             sys.exit(1)
 
-        runs = sorted(log_dir.glob("*_*"))
-        if not runs:
+        run_dir = max(log_dir.glob("*_*"), default=None, key=lambda p: p.name)
+        if run_dir is None:
             print("Error: No profiling runs found in logs directory")
             sys.exit(1)
 
-        run_dir = runs[-1]
         print(f"Using latest run: {run_dir.name}")
 
     if not run_dir.exists():
@@ -11,8 +11,13 @@ Parses the MLIR module dumps to extract function arguments with their:
 - tensor shape and dtype
 """
 
+import functools
+import mmap
+import os
 import re
 import sys
+from collections import namedtuple
+from math import prod
 from typing import Dict, List, Optional, Tuple
 
 # Dtype sizes in bytes
@@ -32,6 +37,27 @@ DTYPE_SIZES = {
     "bool": 1,
 }
 
+# One parsed function argument; converted with _asdict() when written as JSON
+ArgEntry = namedtuple("ArgEntry", "index ssa name type shape dtype bytes")
+
+_TENSOR_TYPE_RE = re.compile(r"tensor<([\dx]+)x([a-zA-Z]\w*)(?:[,>])")
+_SCALAR_TENSOR_TYPE_RE = re.compile(r"tensor<(\d+)x([a-zA-Z]\w*)(?:[,>])")
+_SSA_RE = re.compile(r"(%arg\d+)")
+# tensor<shape x dtype> (groups 1, 2) or scalar tensor<dtype> (group 3)
+_TENSOR_FULL_RE = re.compile(
+    r"tensor<(?=[^>]+>)(?:((?:\d+x)+)([a-zA-Z]\w*)|([a-zA-Z]\w*))"
+)
+_ARGTYPE_RE = re.compile(r"ttcore\.argument_type\s*=\s*#ttcore\.argument_type<(\w+)>")
+_NAME_RE = re.compile(r'ttir\.name\s*=\s*"([^"]+)"')
+_ARGS_MAIN_RE = re.compile(r"@main\((.+?)\)\s*(?:->|{)", re.DOTALL)
+# Argument delimiters: commas split arguments only outside of {...} attributes
+_ARG_DELIM_RE = re.compile(r"[{},]")
+
+
+def bytes_to_mb(num_bytes: int) -> float:
+    """Convert a byte count to MB (MiB), for display and summary fields."""
+    return num_bytes / (1024 * 1024)
+
 
 def calculate_tensor_bytes(shape: str, dtype: str) -> int:
     """
@@ -47,14 +73,16 @@ def calculate_tensor_bytes(shape: str, dtype: str) -> int:
     if not shape:
         return 0
 
+    return _tensor_bytes(shape, dtype)
+
+
+@functools.lru_cache(maxsize=4096)
+def _tensor_bytes(shape: str, dtype: str) -> int:
+    """Cached size computation; many arguments share the same (shape, dtype)."""
     dtype_size = DTYPE_SIZES.get(dtype, 4)  # Default to 4 bytes if unknown
 
     try:
-        dims = [int(d) for d in shape.split("x")]
-        num_elements = 1
-        for d in dims:
-            num_elements *= d
-        return num_elements * dtype_size
+        return prod(int(d) for d in shape.split("x")) * dtype_size
     except (ValueError, AttributeError):
         return 0
 
@@ -70,19 +98,19 @@ def parse_tensor_type(type_str: str) -> Tuple[Optional[str], Optional[str]]:
         Tuple of (shape, dtype) e.g., ("768x768x3x3x3", "bf16")
     """
     # Match tensor<shape_dtype> pattern
-    match = re.search(r"tensor<([\dx]+)x([a-zA-Z]\w*)(?:[,>])", type_str)
+    match = _TENSOR_TYPE_RE.search(type_str)
     if match:
         return match.group(1), match.group(2)
 
     # Try simpler pattern for scalar-like tensors
-    match = re.search(r"tensor<(\d+)x([a-zA-Z]\w*)(?:[,>])", type_str)
+    match = _SCALAR_TENSOR_TYPE_RE.search(type_str)
     if match:
         return match.group(1), match.group(2)
 
     return None, None
 
 
-def parse_argument(arg_str: str, index: int) -> Optional[Dict]:
+def parse_argument(arg_str: str, index: int) -> Optional[ArgEntry]:
     """
     Parse a single function argument definition.
 
@@ -91,44 +119,55 @@ def parse_argument(arg_str: str, index: int) -> Optional[Dict]:
         index: Index to assign to this argument
 
     Returns:
-        Dictionary with argument metadata or None if parsing fails
+        ArgEntry with argument metadata or None if parsing fails
     """
     # Extract SSA name (%argN)
-    ssa_match = re.search(r"(%arg\d+)", arg_str)
+    ssa_match = _SSA_RE.search(arg_str)
     if not ssa_match:
         return None
     ssa = ssa_match.group(1)
 
-    # Extract tensor type
-    tensor_match = re.search(r"tensor<([^>]+)>", arg_str)
-    if not tensor_match:
+    # Extract tensor type contents, e.g. "768x768x3x3x3xbf16" or scalar "f32"
+    tensor_start = arg_str.find("tensor<")
+    # Empty tensor<> types are skipped, like a tensor<([^>]+)> search would
+    while tensor_start >= 0 and arg_str.startswith(">", tensor_start + len("tensor<")):
+        tensor_start = arg_str.find("tensor<", tensor_start + 1)
+    if tensor_start < 0:
         return None
-
-    tensor_content = tensor_match.group(1)
-
-    # Parse shape and dtype from tensor content
-    # Handle formats like "768xbf16" or "768x768x3x3x3xbf16"
-    shape_dtype_match = re.match(r"^((?:\d+x)*\d+)x([a-zA-Z]\w*)", tensor_content)
-    if shape_dtype_match:
-        shape = shape_dtype_match.group(1)
-        dtype = shape_dtype_match.group(2)
-    else:
-        # Scalar case
-        dtype_match = re.match(r"^([a-zA-Z]\w*)", tensor_content)
-        if dtype_match:
+    tensor_start += len("tensor<")
+    tensor_end = arg_str.find(">", tensor_start)
+    if tensor_end < 0:
+        return None
+    tensor_content = arg_str[tensor_start:tensor_end].partition(",")[0].rstrip()
+
+    # Fast path: the dtype alphabet is small and fixed, so split off the last
+    # 'x' and look the suffix up in DTYPE_SIZES instead of running a regex
+    shape, _, dtype = tensor_content.rpartition("x")
+    if dtype not in DTYPE_SIZES or not all(map(str.isdecimal, shape.split("x"))):
+        if tensor_content in DTYPE_SIZES:
+            # Scalar case
             shape = None
-            dtype = dtype_match.group(1)
+            dtype = tensor_content
         else:
-            return None
+            # Dtypes outside the size table still parse through the regex,
+            # anchored at the same tensor<...> as the fast path
+            tensor_match = _TENSOR_FULL_RE.match(arg_str, tensor_start - len("tensor<"))
+            if not tensor_match:
+                return None
+
+            if tensor_match.group(1):
+                shape = tensor_match.group(1)[:-1]  # Drop trailing 'x'
+                dtype = tensor_match.group(2)
+            else:
+                shape = None
+                dtype = tensor_match.group(3)
 
     # Extract argument type (parameter/constant/input)
-    arg_type_match = re.search(
-        r"ttcore\.argument_type\s*=\s*#ttcore\.argument_type<(\w+)>", arg_str
-    )
+    arg_type_match = _ARGTYPE_RE.search(arg_str)
     arg_type = arg_type_match.group(1) if arg_type_match else "unknown"
 
     # Extract name from ttir.name
-    name_match = re.search(r'ttir\.name\s*=\s*"([^"]+)"', arg_str)
+    name_match = _NAME_RE.search(arg_str)
     name = name_match.group(1) if name_match else ssa
 
     # Calculate bytes
@@ -136,42 +175,42 @@ def parse_argument(arg_str: str, index: int) -> Optional[Dict]:
         calculate_tensor_bytes(shape, dtype) if shape else DTYPE_SIZES.get(dtype, 4)
     )
 
-    return {
-        "index": index,
-        "ssa": ssa,
-        "name": name,
-        "type": arg_type,
-        "shape": shape,
-        "dtype": dtype,
-        "bytes": bytes_size,
-        "bytes_MB": bytes_size / (1024 * 1024),
-    }
+    return ArgEntry(index, ssa, name, arg_type, shape, dtype, bytes_size)
 
 
 def find_mlir_module_section(
-    lines: List[str], section_name: str = "shlo_frontend"
+    data: bytes, section_name: str = "shlo_frontend"
 ) -> Tuple[int, int]:
     """
-    Find the start and end indices of an MLIR module section in log lines.
+    Find the byte range of an MLIR module section in raw log contents.
 
     Args:
-        lines: List of log lines
+        data: Log file contents (bytes or mmap)
         section_name: Name of the section to find (e.g., 'shlo_frontend', 'shlo_compiler')
 
     Returns:
-        Tuple of (start_index, end_index) or (-1, -1) if not found
+        Tuple of (start_offset, end_offset) spanning the module header line
+        through the END OF MLIR MODULE line, (start_offset, -1) if the module
+        is never closed, or (-1, -1) if not found
     """
-    start_idx = -1
-    end_idx = -1
-
-    for i, line in enumerate(lines):
-        if f"MLIR Module {section_name}:" in line:
-            start_idx = i
-        elif start_idx >= 0 and "END OF MLIR MODULE" in line:
-            end_idx = i
-            break
+    marker = f"MLIR Module {section_name}:".encode()
+
+    start = data.find(marker)
+    if start < 0:
+        return -1, -1
+
+    end = data.find(b"END OF MLIR MODULE", start + len(marker))
+    if end < 0:
+        return data.rfind(b"\n", 0, start) + 1, -1
+
+    # Use the last header before the end marker, as a line-by-line scan would
+    start = data.rfind(marker, start, end)
+
+    line_start = data.rfind(b"\n", 0, start) + 1
+    line_end = data.find(b"\n", end)
+    line_end = len(data) if line_end < 0 else line_end + 1
 
-    return start_idx, end_idx
+    return line_start, line_end
 
 
 def parse_func_signature(lines: List[str], start_idx: int, end_idx: int) -> str:
@@ -189,26 +228,57 @@ def parse_func_signature(lines: List[str], start_idx: int, end_idx: int) -> str:
     Returns:
         Complete function signature string
     """
+    stop_idx = min(end_idx + 1, len(lines))
+
+    # Skip ahead to the @main line with a cheap substring test only;
+    # paren counting is not needed until the signature starts
+    sig_start = -1
+    for i in range(start_idx, stop_idx):
+        if "func.func @main(" in lines[i]:
+            sig_start = i
+            break
+
+    if sig_start < 0:
+        return ""
+
     signature_parts = []
-    in_signature = False
     paren_depth = 0
 
-    for i in range(start_idx, min(end_idx + 1, len(lines))):
+    for i in range(sig_start, stop_idx):
         line = lines[i]
+        signature_parts.append(line)
+        paren_depth += line.count("(") - line.count(")")
 
-        if "func.func @main(" in line:
-            in_signature = True
+        # Check if we've closed the main function signature
+        # Look for pattern like ") -> tensor<" or ") {" after balanced parens
+        if paren_depth <= 0 and (") ->" in line or ") {" in line):
+            break
 
-        if in_signature:
-            signature_parts.append(line)
-            paren_depth += line.count("(") - line.count(")")
+    return " ".join(signature_parts)
 
-            # Check if we've closed the main function signature
-            # Look for pattern like ") -> tensor<" or ") {" after balanced parens
-            if paren_depth <= 0 and (") ->" in line or ") {" in line):
-                break
 
-    return " ".join(signature_parts)
+def _read_mlir_module_lines(data: bytes) -> Optional[List[str]]:
+    """
+    Locate the frontend MLIR module in raw log contents and decode its lines.
+
+    Returns:
+        List of decoded module lines (empty if the module is never closed),
+        or None if no module section was found
+    """
+    # Try to find shlo_frontend section first (has ttcore.argument_type markers),
+    # then fall back to shlo_compiler, then any MLIR module section
+    for section_name in ("shlo_frontend", "shlo_compiler", "shlo"):
+        start_off, end_off = find_mlir_module_section(data, section_name)
+        if start_off >= 0:
+            break
+    else:
+        return None
+
+    if end_off < 0:
+        return []
+
+    text = data[start_off:end_off].decode("utf-8", errors="replace")
+    return text.splitlines(keepends=True)
 
 
 def parse_inputs_registry(log_path: str) -> Dict:
@@ -225,11 +295,17 @@ def parse_inputs_registry(log_path: str) -> Dict:
         log_path: Path to the log file
 
     Returns:
-        Dictionary with 'metadata' and 'entries' keys
+        Dictionary with 'metadata' and 'entries' (list of ArgEntry) keys
     """
     try:
-        with open(log_path, "r", encoding="utf-8", errors="replace") as f:
-            lines = f.readlines()
+        with open(log_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                module_lines = None
+            else:
+                # Search the mapped file with C-level finds and only decode
+                # the module section, not the whole log
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    module_lines = _read_mlir_module_lines(mm)
     except FileNotFoundError:
         print(f"Error: Log file not found: {log_path}", file=sys.stderr)
         return {"metadata": {}, "entries": []}
@@ -237,23 +313,12 @@ def parse_inputs_registry(log_path: str) -> Dict:
         print(f"Error reading log file: {e}", file=sys.stderr)
         return {"metadata": {}, "entries": []}
 
-    # Try to find shlo_frontend section first (has ttcore.argument_type markers)
-    start_idx, end_idx = find_mlir_module_section(lines, "shlo_frontend")
-
-    if start_idx < 0:
-        # Fallback to shlo_compiler section
-        start_idx, end_idx = find_mlir_module_section(lines, "shlo_compiler")
-
-    if start_idx < 0:
-        # Try any MLIR module section
-        start_idx, end_idx = find_mlir_module_section(lines, "shlo")
-
-    if start_idx < 0:
+    if module_lines is None:
         print("Warning: Could not find MLIR module section in log", file=sys.stderr)
         return {"metadata": {}, "entries": []}
 
     # Extract function signature
-    signature = parse_func_signature(lines, start_idx, end_idx)
+    signature = parse_func_signature(module_lines, 0, len(module_lines) - 1)
 
     if not signature:
         print("Warning: Could not find func.func @main signature", file=sys.stderr)
@@ -261,7 +326,7 @@ def parse_inputs_registry(log_path: str) -> Dict:
 
     # Parse individual arguments
     # Find the arguments section between @main( and the return type
-    args_match = re.search(r"@main\((.+?)\)\s*(?:->|{)", signature, re.DOTALL)
+    args_match = _ARGS_MAIN_RE.search(signature)
     if not args_match:
         print("Warning: Could not parse function arguments", file=sys.stderr)
         return {"metadata": {}, "entries": []}
@@ -271,37 +336,37 @@ def parse_inputs_registry(log_path: str) -> Dict:
     # Split arguments - they're separated by commas, but we need to handle
     # nested braces in attributes
     entries = []
-    current_arg = []
+    arg_start = 0
     brace_depth = 0
 
-    for char in args_str:
+    # Only visit delimiter characters; the regex engine skips everything else
+    for match in _ARG_DELIM_RE.finditer(args_str):
+        char = match.group()
         if char == "{":
             brace_depth += 1
         elif char == "}":
             brace_depth -= 1
-        elif char == "," and brace_depth == 0:
+        elif brace_depth == 0:
             # End of argument
-            arg_str = "".join(current_arg).strip()
+            arg_str = args_str[arg_start : match.start()].strip()
             if arg_str:
                 entry = parse_argument(arg_str, len(entries))
                 if entry:
                     entries.append(entry)
-            current_arg = []
-            continue
-        current_arg.append(char)
+            arg_start = match.end()
 
     # Don't forget the last argument
-    arg_str = "".join(current_arg).strip()
+    arg_str = args_str[arg_start:].strip()
     if arg_str:
         entry = parse_argument(arg_str, len(entries))
         if entry:
             entries.append(entry)
 
     # Calculate metadata
-    total_weights = sum(1 for e in entries if e["type"] in ("parameter", "constant"))
-    total_inputs = sum(1 for e in entries if e["type"] == "input")
+    total_weights = sum(1 for e in entries if e.type in ("parameter", "constant"))
+    total_inputs = sum(1 for e in entries if e.type == "input")
     total_weight_bytes = sum(
-        e["bytes"] for e in entries if e["type"] in ("parameter", "constant")
+        e.bytes for e in entries if e.type in ("parameter", "constant")
     )
 
     metadata = {
@@ -309,7 +374,7 @@ def parse_inputs_registry(log_path: str) -> Dict:
         "total_weights": total_weights,
         "total_inputs": total_inputs,
         "total_weight_bytes": total_weight_bytes,
-        "total_weight_MB": total_weight_bytes / (1024 * 1024),
+        "total_weight_MB": bytes_to_mb(total_weight_bytes),
     }
 
     return {"metadata": metadata, "entries": entries}
@@ -324,5 +389,6 @@ if __name__ == "__main__":
 
     log_path = sys.argv[1]
     registry = parse_inputs_registry(log_path)
+    registry["entries"] = [e._asdict() for e in registry["entries"]]
 
     print(json.dumps(registry, indent=2))
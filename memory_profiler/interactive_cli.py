@@ -15,14 +15,14 @@ Supports both interactive mode and command-line mode:
 """
 
 import argparse
-import http.server
+import functools
+import json
 import os
-import socket
 import socketserver
+import stat
 import sys
-import threading
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
 # Handle both package import and direct execution
 try:
@@ -35,27 +35,24 @@ except ImportError:
     from run_profiled import sanitize_report_name, get_reports_dir
 
 
+@functools.lru_cache(maxsize=None)
 def _import_interactive_deps():
     """Import dependencies needed for interactive mode. Returns True if successful."""
-    global Console, Panel, Spinner, Live, inquirer, Choice, InquirerPyStyle
-    global MemoryVisualizer, CUSTOM_STYLE, console
+    global Console, Panel, Spinner, Live, Text, inquirer, Choice, InquirerPyStyle
+    global CUSTOM_STYLE, console
 
     try:
         from rich.console import Console
         from rich.panel import Panel
         from rich.spinner import Spinner
         from rich.live import Live
+        from rich.text import Text
         from InquirerPy import inquirer
         from InquirerPy.base.control import Choice
         from InquirerPy.utils import InquirerPyStyle
     except ImportError:
         return False
 
-    try:
-        from .visualizer import MemoryVisualizer
-    except ImportError:
-        from visualizer import MemoryVisualizer
-
     # Custom style for InquirerPy prompts (cyan/blue theme matching the logo)
     CUSTOM_STYLE = InquirerPyStyle({
         "questionmark": "fg:cyan bold",
@@ -70,6 +67,15 @@ def _import_interactive_deps():
     console = Console()
     return True
 
+
+def _get_visualizer():
+    """Import MemoryVisualizer only when an HTML report is actually generated."""
+    try:
+        from .visualizer import MemoryVisualizer
+    except ImportError:
+        from visualizer import MemoryVisualizer
+    return MemoryVisualizer
+
 # ASCII Logo using only - and | characters
 LOGO = r"""
  |----|  |----|  |\    /|  |-----  |\    /|
@@ -83,19 +89,22 @@ LOGO = r"""
 console = None
 
 
-def display_intro() -> None:
-    """Display the ASCII logo and welcome message."""
-    console.print(
-        Panel(
-            f"[cyan]{LOGO}[/cyan]\n[bold]Welcome to ttmem![/bold] Memory profiling made easy.",
-            border_style="cyan",
-            padding=(1, 2),
-        )
+# Static panels are built once; rich only has to lay them out on reprint
+@functools.lru_cache(maxsize=None)
+def _intro_panel():
+    """Build the logo panel shown by display_intro()."""
+    return Panel(
+        Text.from_markup(
+            f"[cyan]{LOGO}[/cyan]\n[bold]Welcome to ttmem![/bold] Memory profiling made easy."
+        ),
+        border_style="cyan",
+        padding=(1, 2),
     )
 
 
-def display_instructions() -> None:
-    """Display prerequisites for generating memory logs."""
+@functools.lru_cache(maxsize=None)
+def _instructions_panel():
+    """Build the prerequisites panel shown by display_instructions()."""
     instructions = """
 [bold yellow]Prerequisites for Memory Logging:[/bold yellow]
 
@@ -115,16 +124,24 @@ def display_instructions() -> None:
    This will generate a log file at:
    [cyan]./logs/<script_name>_YYYYMMDD_HHMMSS/<script_name>_profile.log[/cyan]
 """
-    console.print(
-        Panel(
-            instructions,
-            title="[bold]Getting Started[/bold]",
-            border_style="yellow",
-            padding=(1, 2),
-        )
+    return Panel(
+        Text.from_markup(instructions),
+        title="[bold]Getting Started[/bold]",
+        border_style="yellow",
+        padding=(1, 2),
     )
 
 
+def display_intro() -> None:
+    """Display the ASCII logo and welcome message."""
+    console.print(_intro_panel())
+
+
+def display_instructions() -> None:
+    """Display prerequisites for generating memory logs."""
+    console.print(_instructions_panel())
+
+
 def ask_has_log_file() -> Optional[str]:
     """Ask the user if they already have a log file.
 
@@ -197,29 +214,79 @@ def validate_log_path(path: str) -> Optional[str]:
     if not path:
         return "Path cannot be empty"
 
-    file_path = Path(path)
-
-    if not file_path.exists():
+    # One stat call answers existence, file type and size together
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
         return f"File not found: {path}"
+    except OSError as e:
+        return f"Cannot access {path}: {e.strerror}"
 
-    if not file_path.is_file():
+    if not stat.S_ISREG(st.st_mode):
         return f"Not a file: {path}"
 
-    if not os.access(file_path, os.R_OK):
+    if not os.access(path, os.R_OK):
         return f"File is not readable: {path}"
 
     # Check if file has content
-    if file_path.stat().st_size == 0:
+    if st.st_size == 0:
         return f"File is empty: {path}"
 
     return None
 
 
-def process_log_file(log_path: str) -> Optional[Path]:
+# File in a report directory recording which log its outputs were parsed from
+_SOURCE_LOG_FILE = ".source_log.json"
+
+
+def _source_log_identity(log_file: Path) -> Dict:
+    """Return the resolved path, mtime and size identifying a log file."""
+    st = log_file.stat()
+    return {"path": str(log_file.resolve()), "mtime_ns": st.st_mtime_ns, "size": st.st_size}
+
+
+def _outputs_fresh(log_file: Path, run_dir: Path, outputs: Tuple[Path, ...]) -> bool:
+    """Return True if every output was parsed from this log and is at least as new as it.
+
+    Runs of the same script share a report directory, so the outputs being
+    newer than the log is not enough: the log recorded by _record_source_log()
+    must also be this one, unchanged.
+    """
+    try:
+        identity = _source_log_identity(log_file)
+        with open(run_dir / _SOURCE_LOG_FILE, encoding="utf-8") as f:
+            if json.load(f) != identity:
+                return False
+        return min(p.stat().st_mtime_ns for p in outputs) >= identity["mtime_ns"]
+    except (OSError, ValueError):
+        return False
+
+
+def _record_source_log(log_file: Path, run_dir: Path) -> None:
+    """Record the log that the outputs in run_dir were parsed from."""
+    try:
+        with open(run_dir / _SOURCE_LOG_FILE, "w", encoding="utf-8") as f:
+            json.dump(_source_log_identity(log_file), f)
+    except OSError:
+        # Without the record the next run just parses again
+        pass
+
+
+def _forget_source_log(run_dir: Path) -> None:
+    """Drop the source log record before the outputs in run_dir are rewritten."""
+    try:
+        (run_dir / _SOURCE_LOG_FILE).unlink()
+    except OSError:
+        pass
+
+
+def process_log_file(log_path: str, force: bool = False) -> Optional[Path]:
     """
     Process the log file and generate the HTML report.
 
     Reports are saved to ~/.ttmem/reports/<report_name>/ with sanitized names.
+    Parsing is skipped when the JSON outputs were parsed from this same log
+    and are newer than it, unless force is set.
 
     Returns the path to the generated report, or None on failure.
     """
@@ -239,19 +306,27 @@ def process_log_file(log_path: str) -> Optional[Path]:
     console.print()
     console.print(f"[dim]Output directory: {run_dir}[/dim]")
 
-    # Step 1: Parse log file
-    with console.status("[bold cyan]Parsing log file...", spinner="dots") as status:
-        try:
-            parse_log_file(
-                str(log_file),
-                str(mem_output),
-                str(ops_output),
-                str(registry_output),
-                str(ir_output),
-            )
-        except Exception as e:
-            console.print(f"[red]Error parsing log file: {e}[/red]")
-            return None
+    # Step 1: Parse log file (skipped if a previous parse of this log is up to date)
+    outputs = (mem_output, ops_output, registry_output, ir_output)
+    parsed = None
+    if not force and _outputs_fresh(log_file, run_dir, outputs):
+        console.print("[dim]Outputs are up to date, skipping parse (use --force to re-parse)[/dim]")
+    else:
+        with console.status("[bold cyan]Parsing log file...", spinner="dots") as status:
+            _forget_source_log(run_dir)
+            try:
+                parsed = parse_log_file(
+                    str(log_file),
+                    str(mem_output),
+                    str(ops_output),
+                    str(registry_output),
+                    str(ir_output),
+                )
+            except Exception as e:
+                console.print(f"[red]Error parsing log file: {e}[/red]")
+                return None
+            if parsed is not None:
+                _record_source_log(log_file, run_dir)
 
     # Step 2: Validate outputs
     with console.status("[bold cyan]Validating outputs...", spinner="dots") as status:
@@ -262,6 +337,7 @@ def process_log_file(log_path: str) -> Optional[Path]:
     # Step 3: Generate visualization
     with console.status("[bold cyan]Generating HTML report...", spinner="dots") as status:
         try:
+            MemoryVisualizer = _get_visualizer()
             visualizer = MemoryVisualizer(run_dir, script_name=report_name)
             report_path = visualizer.generate_report()
         except Exception as e:
@@ -271,39 +347,44 @@ def process_log_file(log_path: str) -> Optional[Path]:
     return report_path
 
 
-def find_available_port(start_port: int = 8000, max_attempts: int = 100) -> int:
-    """Find an available port starting from start_port."""
-    for port in range(start_port, start_port + max_attempts):
-        try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.bind(("0.0.0.0", port))
-                return port
-        except OSError:
-            continue
-    raise RuntimeError(f"Could not find available port in range {start_port}-{start_port + max_attempts}")
-
-
-def start_http_server(directory: Path, port: int) -> Tuple[socketserver.TCPServer, threading.Thread]:
-    """Start an HTTP server in the background serving the given directory.
+def create_http_server(directory: Path, port: int = 0) -> socketserver.TCPServer:
+    """Bind an HTTP server for the given directory without starting it.
 
     Binds to 0.0.0.0 so VS Code Remote SSH can auto-forward the port.
+    With the default port 0 the kernel picks a free port; read it back
+    from server.server_address[1].
     """
-    handler = http.server.SimpleHTTPRequestHandler
+    # Imported here so --llm and --help never load the HTTP stack
+    import http.server
 
-    class QuietHandler(handler):
+    class QuietHandler(http.server.SimpleHTTPRequestHandler):
         """HTTP handler that suppresses log messages."""
         def log_message(self, format, *args):
             pass  # Suppress logging
 
-    os.chdir(directory)
+    # Serve from the report directory without changing the process cwd
+    handler = functools.partial(QuietHandler, directory=str(directory))
+
     # Bind to 0.0.0.0 to allow connections from any interface
-    # This enables VS Code's automatic port forwarding for remote development
-    server = socketserver.TCPServer(("0.0.0.0", port), QuietHandler)
+    # This enables VS Code's automatic port forwarding for remote development.
+    # ThreadingHTTPServer serves parallel asset requests and sets
+    # allow_reuse_address so repeated runs don't hit TIME_WAIT bind errors.
+    return http.server.ThreadingHTTPServer(("0.0.0.0", port), handler)
 
-    thread = threading.Thread(target=server.serve_forever, daemon=True)
-    thread.start()
 
-    return server, thread
+def serve_until_interrupted(server: socketserver.TCPServer) -> None:
+    """Serve requests on the calling thread until Ctrl+C, then close the server.
+
+    serve_forever() sleeps in select() between requests, so the idle
+    viewer costs no CPU and needs no extra thread. Ctrl+C raises
+    KeyboardInterrupt out of serve_forever() on this same thread.
+    """
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
 
 
 def browse_existing_reports() -> None:
@@ -325,12 +406,18 @@ def browse_existing_reports() -> None:
         return
 
     # Find all report directories that contain HTML files
+    # scandir reuses the dirent type info and stops at the first HTML file
     report_dirs = []
-    for item in sorted(reports_dir.iterdir()):
-        if item.is_dir():
-            html_files = list(item.glob("*.html"))
-            if html_files:
-                report_dirs.append((item.name, html_files[0]))
+    with os.scandir(reports_dir) as it:
+        entries = sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
+    for entry in entries:
+        with os.scandir(entry.path) as sub:
+            html_path = next(
+                (Path(f.path) for f in sub if f.name.endswith(".html") and f.is_file()),
+                None,
+            )
+        if html_path:
+            report_dirs.append((entry.name, html_path))
 
     if not report_dirs:
         console.print(
@@ -369,25 +456,22 @@ def browse_existing_reports() -> None:
 
     # If server is running, wait for Ctrl+C
     if server:
-        try:
-            console.print("\n[dim]Press Ctrl+C to stop the server and return to menu.[/dim]")
-            while True:
-                pass
-        except KeyboardInterrupt:
-            server.shutdown()
-            console.print("\n[yellow]Server stopped.[/yellow]\n")
+        console.print("\n[dim]Press Ctrl+C to stop the server and return to menu.[/dim]")
+        serve_until_interrupted(server)
+        console.print("\n[yellow]Server stopped.[/yellow]\n")
 
 
 def display_success(report_path: Path) -> Optional[socketserver.TCPServer]:
     """
     Display success message with HTTP URL for the report.
 
-    Always starts an HTTP server and returns the server instance.
+    Always binds an HTTP server and returns the server instance; the
+    caller serves it with serve_until_interrupted().
     """
     server = None
     try:
-        port = find_available_port()
-        server, _ = start_http_server(report_path.parent, port)
+        server = create_http_server(report_path.parent)
+        port = server.server_address[1]
         # Use localhost since VS Code Remote SSH will auto-forward the port
         http_url = f"http://localhost:{port}/{report_path.name}"
 
@@ -420,13 +504,16 @@ def display_success(report_path: Path) -> Optional[socketserver.TCPServer]:
     return server
 
 
-def generate_llm_report(log_path: str, output_file: Optional[Path] = None) -> int:
+def generate_llm_report(
+    log_path: str, output_file: Optional[Path] = None, force: bool = False
+) -> int:
     """
     Generate LLM-friendly text report from a log file.
 
     Args:
         log_path: Path to the log file to analyze
         output_file: Optional output file path. If None, prints to stdout.
+        force: Re-parse the log even if the JSON outputs are up to date
 
     Returns:
         0 on success, 1 on failure
@@ -455,22 +542,32 @@ def generate_llm_report(log_path: str, output_file: Optional[Path] = None) -> in
     registry_output = run_dir / f"{report_name}_inputs_registry.json"
     ir_output = run_dir / f"{report_name}_ir.json"
 
-    # Parse log file (suppress output when generating to stdout)
-    try:
+    # Parse log file (suppress output when generating to stdout), unless a
+    # previous parse of this same log is still up to date
+    outputs = (mem_output, ops_output, registry_output, ir_output)
+    parsed = None
+    if not force and _outputs_fresh(log_file, run_dir, outputs):
         if output_file:
-            print(f"Parsing log file: {log_file}", file=sys.stderr)
-            print(f"Output directory: {run_dir}", file=sys.stderr)
-
-        parse_log_file(
-            str(log_file),
-            str(mem_output),
-            str(ops_output),
-            str(registry_output),
-            str(ir_output),
-        )
-    except Exception as e:
-        print(f"Error parsing log file: {e}", file=sys.stderr)
-        return 1
+            print(f"Outputs are up to date in: {run_dir}", file=sys.stderr)
+    else:
+        try:
+            if output_file:
+                print(f"Parsing log file: {log_file}", file=sys.stderr)
+                print(f"Output directory: {run_dir}", file=sys.stderr)
+
+            _forget_source_log(run_dir)
+            parsed = parse_log_file(
+                str(log_file),
+                str(mem_output),
+                str(ops_output),
+                str(registry_output),
+                str(ir_output),
+            )
+        except Exception as e:
+            print(f"Error parsing log file: {e}", file=sys.stderr)
+            return 1
+        if parsed is not None:
+            _record_source_log(log_file, run_dir)
 
     # Validate outputs
     if not validate_outputs(str(mem_output), str(ops_output)):
@@ -480,12 +577,13 @@ def generate_llm_report(log_path: str, output_file: Optional[Path] = None) -> in
     # Generate LLM report
     try:
         formatter = LLMTextFormatter(run_dir, script_name=report_name)
-        report = formatter.generate_report(output_file=output_file)
 
         if output_file:
+            # Streamed to the file, never built in memory as a whole
+            formatter.write_report(output_file)
             print(f"LLM report written to: {output_file}", file=sys.stderr)
         else:
-            print(report)
+            print(formatter.generate_report())
 
         return 0
     except FileNotFoundError as e:
@@ -528,6 +626,11 @@ Examples:
         metavar="FILE",
         help="Write LLM report to file instead of stdout (use with --llm)",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-parse the log even if the JSON outputs are newer than it",
+    )
     return parser.parse_args()
 
 
@@ -541,7 +644,7 @@ def main() -> int:
             print("Error: --llm requires --logfile", file=sys.stderr)
             return 1
         output_file = Path(args.output_file) if args.output_file else None
-        return generate_llm_report(args.logfile, output_file)
+        return generate_llm_report(args.logfile, output_file, force=args.force)
 
     # Interactive mode - requires rich and InquirerPy
     if not _import_interactive_deps():
@@ -605,7 +708,7 @@ def main() -> int:
             return 1
 
         # Process the log file
-        report_path = process_log_file(log_path)
+        report_path = process_log_file(log_path, force=args.force)
 
         if report_path is None:
             return 1
@@ -615,13 +718,9 @@ def main() -> int:
 
         # If server is running, wait for Ctrl+C
         if server:
-            try:
-                console.print("\n[dim]Press Ctrl+C to stop the server and exit.[/dim]")
-                while True:
-                    pass
-            except KeyboardInterrupt:
-                server.shutdown()
-                console.print("\n[yellow]Server stopped.[/yellow]")
+            console.print("\n[dim]Press Ctrl+C to stop the server and exit.[/dim]")
+            serve_until_interrupted(server)
+            console.print("\n[yellow]Server stopped.[/yellow]")
 
         return 0
 
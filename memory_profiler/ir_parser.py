@@ -12,67 +12,68 @@ Parses MLIR module dumps to extract:
 """
 
 import json
+import mmap
+import os
 import re
 import sys
 from typing import Dict, List, Optional, Tuple
 
+# Log prefixes in front of module lines: optional timestamp, optional log
+# level, then an optional RuntimeTTNN tag, stripped in that order.
+# Applied to raw lines, before the module is decoded.
+_LOG_PREFIX_RE = re.compile(
+    rb"^(?:\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}\.\d+\s+)?"
+    rb"(?:(?:DEBUG|INFO|WARNING|ERROR)\s+)?"
+    rb"(?:RuntimeTTNN:\s*)?"
+)
 
-def find_ir_module_boundaries(
-    lines: List[str], module_type: str
-) -> Tuple[int, int]:
-    """
-    Find the start and end indices of an IR module section in log lines.
+# Location tokens in IR text, one alternative per kind:
+# #loc56 = loc("multiply.3545") | loc(#loc56) | loc("name") | load_cached(@func)
+# No token spans a newline, so scanning the whole text finds the same
+# tokens as scanning line by line.
+_LOC_TOKEN_RE = re.compile(
+    r'(?P<alias>#loc\d+)[^\S\n]*=[^\S\n]*loc\("(?P<alias_name>[^"\n]+)"'
+    r'|loc\((?P<ref>#loc\d+)\)'
+    r'|loc\("(?P<inline>[^"\n]+)"'
+    r'|load_cached\((?P<func>@[\w.]+)'
+)
 
-    Looks for exact module name match: "MLIR Module ttir:" or "MLIR Module ttnn:"
-    This avoids incorrectly matching shlo_frontend or shlo_compiler modules.
+# Alias definition lines, e.g. "  #loc56 = ...", matched at a line start
+_ALIAS_DEF_LINE_RE = re.compile(r'[^\S\n]*#loc\d+[^\S\n]*=')
 
-    Args:
-        lines: List of log lines
-        module_type: Type of module to find ('ttir' or 'ttnn')
+# Both modules must be at least this long before they are indexed in
+# separate processes
+_PARALLEL_INDEX_MIN_CHARS = 4 * 1024 * 1024
 
-    Returns:
-        Tuple of (start_index, end_index) or (-1, -1) if not found
-    """
-    start_idx = -1
-    target_marker = f"MLIR Module {module_type}:"
+# Module boundary markers, matched against raw (undecoded) log lines
+_MODULE_END_MARKER = b"END OF MLIR MODULE"
 
-    for i, line in enumerate(lines):
-        if target_marker in line:
-            start_idx = i
-        elif start_idx >= 0 and "END OF MLIR MODULE" in line:
-            return start_idx, i
 
-    return -1, -1
+def _module_marker(module_type: str) -> bytes:
+    """Return the raw header marker for a module type, e.g. b'MLIR Module ttir:'."""
+    return f"MLIR Module {module_type}:".encode()
 
 
-def extract_module_text(lines: List[str], start_idx: int, end_idx: int) -> str:
+def extract_module_text(module_lines: List[bytes]) -> str:
     """
-    Extract the IR module text from log lines.
+    Extract the IR module text from raw module lines.
+
+    Prefixes are stripped on the raw bytes and the module is decoded once
+    at the end, instead of decoding every line separately.
 
     Args:
-        lines: List of log lines
-        start_idx: Start index of module
-        end_idx: End index of module
+        module_lines: Raw module lines (bytes), starting with the header line
 
     Returns:
         Module text as a single string
     """
-    if start_idx < 0 or end_idx < 0:
-        return ""
+    # Skip the header line and extract just the module content,
+    # removing common log prefixes with one anchored substitution per line
+    buf = bytearray()
+    for line in module_lines[1:]:
+        buf += _LOG_PREFIX_RE.sub(b"", line, count=1)
 
-    # Skip the header line and extract just the module content
-    module_lines = []
-    for i in range(start_idx + 1, end_idx):
-        line = lines[i]
-        # Remove common log prefixes (timestamps, log levels, etc.)
-        # Pattern: optional timestamp, optional log level, then content
-        cleaned = re.sub(r"^\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}\.\d+\s+", "", line)
-        cleaned = re.sub(r"^(DEBUG|INFO|WARNING|ERROR)\s+", "", cleaned)
-        # Remove RuntimeTTNN prefix if present
-        cleaned = re.sub(r"^RuntimeTTNN:\s*", "", cleaned)
-        module_lines.append(cleaned)
-
-    return "".join(module_lines)
+    return buf.decode("utf-8", errors="replace")
 
 
 def build_loc_line_index(ir_text: str) -> Dict[str, int]:
@@ -93,58 +94,178 @@ def build_loc_line_index(ir_text: str) -> Dict[str, int]:
     Returns:
         Dictionary mapping location identifiers to line numbers
     """
-    lines = ir_text.split("\n")
     loc_index = {}
 
-    # Step 1: Build alias -> name mapping from definitions
-    # Pattern: #loc56 = loc("multiply.3545")
-    alias_to_name = {}
-    alias_def_pattern = re.compile(r'(#loc\d+)\s*=\s*loc\("([^"]+)"')
-
-    for line in lines:
-        match = alias_def_pattern.search(line)
-        if match:
-            alias_to_name[match.group(1)] = match.group(2)  # #loc56 -> "multiply.3545"
-
-    # Step 2: Find operations that reference loc(#locN)
-    # Pattern: anything ... loc(#loc56)
-    op_loc_pattern = re.compile(r'loc\((#loc\d+)\)')
-
-    for line_num, line in enumerate(lines, start=1):
-        match = op_loc_pattern.search(line)
-        if match:
-            alias = match.group(1)  # #loc56
-            if alias in alias_to_name:
-                name = alias_to_name[alias]  # "multiply.3545"
-                if name not in loc_index:
-                    loc_index[name] = line_num
-
-    # Step 3: Also handle inline loc("name") patterns for ops without aliases
-    # Pattern: loc("something") directly in operation lines
-    inline_loc_pattern = re.compile(r'loc\("([^"]+)"')
-
-    for line_num, line in enumerate(lines, start=1):
-        # Skip alias definition lines (they start with #loc)
-        if re.match(r'\s*#loc\d+\s*=', line):
-            continue
-        matches = inline_loc_pattern.findall(line)
-        for loc_id in matches:
-            if loc_id not in loc_index:
-                loc_index[loc_id] = line_num
+    # Single scan over the whole text: _LOC_TOKEN_RE finds every kind of
+    # location token. Matches are collected per kind and resolved
+    # afterwards with the same precedence as separate passes. Line
+    # numbers are tracked by counting newlines between consecutive
+    # matches, so the text is never split into a list of lines.
 
-    # Step 4: Handle ttcore.load_cached operations with loc(unknown)
+    alias_to_name = {}
+    op_refs = []  # (line_num, alias), first reference per line
+    inline_locs = []  # (line_num, name), alias definition lines excluded
+    load_cached_funcs = []  # (line_num, @func), first call per line
+
+    line_num = 1
+    pos = 0
+    current_line = 0
+    is_alias_def = seen_alias = seen_ref = seen_func = False
+
+    for match in _LOC_TOKEN_RE.finditer(ir_text):
+        start = match.start()
+        line_num += ir_text.count("\n", pos, start)
+        pos = start
+        if line_num != current_line:
+            current_line = line_num
+            # Alias definition lines (they start with #loc) only define names
+            line_start = ir_text.rfind("\n", 0, start) + 1
+            is_alias_def = _ALIAS_DEF_LINE_RE.match(ir_text, line_start) is not None
+            seen_alias = seen_ref = seen_func = False
+
+        kind = match.lastgroup
+        if kind == "alias_name":
+            if not seen_alias:
+                seen_alias = True
+                alias_to_name[match.group("alias")] = match.group("alias_name")
+            # An alias definition after other text on an op line still
+            # carries an inline loc("name")
+            if not is_alias_def:
+                inline_locs.append((line_num, match.group("alias_name")))
+        elif kind == "ref":
+            if not seen_ref:
+                seen_ref = True
+                op_refs.append((line_num, match.group("ref")))
+        elif kind == "inline":
+            if not is_alias_def:
+                inline_locs.append((line_num, match.group("inline")))
+        elif not seen_func:
+            seen_func = True
+            load_cached_funcs.append((line_num, match.group("func")))
+
+    # Step 1: Operations that reference loc(#locN) map to the alias name
+    # (alias definitions usually come after their uses, hence the deferral)
+    for line_num, alias in op_refs:
+        name = alias_to_name.get(alias)
+        if name is not None:
+            loc_index.setdefault(name, line_num)
+
+    # Step 2: Also handle inline loc("name") patterns for ops without aliases
+    for line_num, loc_id in inline_locs:
+        loc_index.setdefault(loc_id, line_num)
+
+    # Step 3: Handle ttcore.load_cached operations with loc(unknown)
     # Map @function_name to the line where load_cached appears
-    load_cached_pattern = re.compile(r'load_cached\((@[\w.]+)')
-    for line_num, line in enumerate(lines, start=1):
-        match = load_cached_pattern.search(line)
-        if match:
-            func_name = match.group(1)  # "@main_const_eval_0"
-            if func_name not in loc_index:
-                loc_index[func_name] = line_num
+    for line_num, func_name in load_cached_funcs:
+        loc_index.setdefault(func_name, line_num)
 
     return loc_index
 
 
+def find_ir_module_section(data: bytes, module_type: str) -> Tuple[int, int]:
+    """
+    Find the byte range of an IR module section in raw log contents.
+
+    Looks for exact module name match: "MLIR Module ttir:" or "MLIR Module ttnn:"
+    This avoids incorrectly matching shlo_frontend or shlo_compiler modules.
+
+    The scan is done by C-level find calls, so mmapped logs are never split
+    into lines. A repeated header restarts the module and the first closed
+    module is used.
+
+    Args:
+        data: Log file contents (bytes or mmap)
+        module_type: Type of module to find ('ttir' or 'ttnn')
+
+    Returns:
+        Tuple of (start_offset, end_offset) spanning the header line up to
+        (not including) the END OF MLIR MODULE line, or (-1, -1) if not found
+    """
+    marker = _module_marker(module_type)
+
+    header = data.find(marker)
+    while header >= 0:
+        body_start = data.find(b"\n", header)
+        if body_start < 0:
+            break
+        body_start += 1
+
+        end = data.find(_MODULE_END_MARKER, body_start)
+        if end < 0:
+            break
+        end_line_start = data.rfind(b"\n", 0, end) + 1
+        end_line_end = data.find(b"\n", end)
+        if end_line_end < 0:
+            end_line_end = len(data)
+
+        # A header before the end marker (or on its line) restarts the module
+        restart = data.rfind(marker, body_start, end_line_end)
+        if restart >= 0:
+            header = restart
+            continue
+
+        return data.rfind(b"\n", 0, header) + 1, end_line_start
+
+    return -1, -1
+
+
+def _read_ir_module_lines(data: bytes, module_type: str) -> Optional[List[bytes]]:
+    """
+    Slice one IR module out of raw log contents as raw lines.
+
+    Newlines are normalised the way text-mode reads would, so the cleaned
+    module text matches what a universal-newlines read produced.
+
+    Returns:
+        Raw module lines starting with the header line, or None if the
+        module was not found
+    """
+    start, end = find_ir_module_section(data, module_type)
+    if start < 0:
+        return None
+
+    module_bytes = data[start:end]
+    if b"\r" in module_bytes:
+        module_bytes = module_bytes.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    return module_bytes.splitlines(keepends=True)
+
+
+def _build_loc_line_indices(texts: Dict[str, str]) -> Dict[str, Dict[str, int]]:
+    """
+    Build the location index of each module, in parallel for large modules.
+
+    The regex scan holds the GIL, so threads would not overlap; when both
+    modules are large enough to amortise worker startup and pickling (and
+    there is more than one CPU), each is indexed in its own process
+    instead. Otherwise, inside a daemon process (which may not have
+    children), or if the pool cannot be started, the modules are indexed
+    in this process.
+    """
+    if (
+        len(texts) > 1
+        and (os.cpu_count() or 1) > 1
+        and min(map(len, texts.values())) >= _PARALLEL_INDEX_MIN_CHARS
+    ):
+        try:
+            # Only pay for the multiprocessing imports when a pool is used
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            if not multiprocessing.current_process().daemon:
+                with ProcessPoolExecutor(max_workers=len(texts)) as executor:
+                    futures = {
+                        module_type: executor.submit(build_loc_line_index, text)
+                        for module_type, text in texts.items()
+                    }
+                    return {module_type: f.result() for module_type, f in futures.items()}
+        except Exception as e:
+            # Pool startup fails in many platform-specific ways (missing
+            # _multiprocessing, spawn without a main guard, broken workers)
+            print(f"Warning: Parallel IR indexing unavailable ({e}), indexing serially", file=sys.stderr)
+
+    return {module_type: build_loc_line_index(text) for module_type, text in texts.items()}
+
+
 def parse_ir_modules(log_path: str) -> Dict:
     """
     Parse IR modules from a log file.
@@ -164,8 +285,16 @@ def parse_ir_modules(log_path: str) -> Dict:
         Returns empty dict entries if modules are not found.
     """
     try:
-        with open(log_path, "r", encoding="utf-8", errors="replace") as f:
-            lines = f.readlines()
+        # Search the mapped file with C-level finds; only the cleaned
+        # module text is ever decoded, not the whole log
+        modules = {}
+        with open(log_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size > 0:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    for module_type in ("ttir", "ttnn"):
+                        module_lines = _read_ir_module_lines(mm, module_type)
+                        if module_lines is not None:
+                            modules[module_type] = module_lines
     except FileNotFoundError:
         print(f"Error: Log file not found: {log_path}", file=sys.stderr)
         return {"ttir": {"text": "", "loc_index": {}}, "ttnn": {"text": "", "loc_index": {}}}
@@ -178,21 +307,21 @@ def parse_ir_modules(log_path: str) -> Dict:
         "ttnn": {"text": "", "loc_index": {}},
     }
 
-    # Find and parse TTIR module
-    ttir_start, ttir_end = find_ir_module_boundaries(lines, "ttir")
-    if ttir_start >= 0:
-        ttir_text = extract_module_text(lines, ttir_start, ttir_end)
-        result["ttir"]["text"] = ttir_text
-        result["ttir"]["loc_index"] = build_loc_line_index(ttir_text)
-        print(f"Found TTIR module: {len(ttir_text)} chars, {len(result['ttir']['loc_index'])} locations")
-
-    # Find and parse TTNN module
-    ttnn_start, ttnn_end = find_ir_module_boundaries(lines, "ttnn")
-    if ttnn_start >= 0:
-        ttnn_text = extract_module_text(lines, ttnn_start, ttnn_end)
-        result["ttnn"]["text"] = ttnn_text
-        result["ttnn"]["loc_index"] = build_loc_line_index(ttnn_text)
-        print(f"Found TTNN module: {len(ttnn_text)} chars, {len(result['ttnn']['loc_index'])} locations")
+    texts = {
+        module_type: extract_module_text(module_lines)
+        for module_type, module_lines in modules.items()
+    }
+    loc_indices = _build_loc_line_indices(texts)
+
+    # Report found TTIR/TTNN modules
+    for module_type, label in (("ttir", "TTIR"), ("ttnn", "TTNN")):
+        if module_type in texts:
+            result[module_type]["text"] = texts[module_type]
+            result[module_type]["loc_index"] = loc_indices[module_type]
+            print(
+                f"Found {label} module: {len(texts[module_type])} chars, "
+                f"{len(loc_indices[module_type])} locations"
+            )
 
     return result
 
@@ -10,6 +10,18 @@ import re
 import sys
 from typing import Dict, List, Optional
 
+_OPTYPE_RE = re.compile(r"before operation (\w+)")
+_MEM_LINE_RE = re.compile(r"Device (DRAM|L1 SMALL|L1_SMALL|L1|TRACE) memory state")
+
+# Handle both "L1_SMALL" and "L1 SMALL" formats
+_MEM_TYPE_KEYS = {
+    "DRAM": "DRAM",
+    "L1": "L1",
+    "L1_SMALL": "L1_SMALL",
+    "L1 SMALL": "L1_SMALL",
+    "TRACE": "TRACE",
+}
+
 
 def parse_memory_stats(lines: List[str], start_idx: int) -> Optional[Dict]:
     """
@@ -36,29 +48,19 @@ def parse_memory_stats(lines: List[str], start_idx: int) -> Optional[Dict]:
         return None
 
     # Extract operation type from header line
-    op_type_match = re.search(r"before operation (\w+)", lines[start_idx])
+    op_type_match = _OPTYPE_RE.search(lines[start_idx])
     op_type = op_type_match.group(1) if op_type_match else None
 
     # Parse next 4 lines for DRAM, L1, L1_SMALL, TRACE
     memory_data = {}
-    memory_types = ["DRAM", "L1", "L1_SMALL", "TRACE"]
-
-    for i, mem_type in enumerate(memory_types):
-        line_idx = start_idx + i + 1
-        if line_idx >= len(lines):
-            break
 
+    for line_idx in range(start_idx + 1, min(start_idx + 5, len(lines))):
         line = lines[line_idx]
-        # Handle both "L1_SMALL" and "L1 SMALL" formats
-        search_type = mem_type.replace("_", " ")
-
-        if (
-            f"Device {mem_type} memory state" in line
-            or f"Device {search_type} memory state" in line
-        ):
+        mem_line_match = _MEM_LINE_RE.search(line)
+        if mem_line_match:
             mem_stats = parse_memory_view(line)
             if mem_stats:
-                memory_data[mem_type] = mem_stats
+                memory_data[_MEM_TYPE_KEYS[mem_line_match.group(1)]] = mem_stats
 
     if not memory_data:
         return None
@@ -79,38 +81,51 @@ def parse_memory_view(line: str) -> Optional[Dict]:
     Returns:
         Dictionary with parsed memory statistics, or None if parsing fails
     """
-    match = re.search(r"MemoryView\{([^}]+)\}", line)
-    if not match:
+    start = line.find("MemoryView{")
+    if start < 0:
+        return None
+    start += len("MemoryView{")
+    end = line.find("}", start)
+    if end <= start:
         return None
 
-    content = match.group(1)
     stats = {}
 
-    # Parse key-value pairs separated by commas
-    for pair in content.split(","):
-        key_val = pair.split(":")
-        if len(key_val) == 2:
-            key = key_val[0].strip()
-            val = key_val[1].strip()
-
-            # Convert MB values to float
-            if "MB" in val:
-                try:
-                    val = float(val.replace("MB", "").strip())
-                    key = key + "_MB"
-                except ValueError:
-                    print(f"Warning: Could not parse MB value: {val}", file=sys.stderr)
-                    continue
-            elif key == "numBanks":
-                try:
-                    val = int(val)
-                except ValueError:
-                    print(
-                        f"Warning: Could not parse numBanks value: {val}",
-                        file=sys.stderr,
-                    )
-                    continue
-
-            stats[key] = val
+    # Walk key-value pairs in place between the braces; only the key and
+    # value substrings of the current pair are ever allocated
+    cursor = start
+    while cursor < end:
+        comma = line.find(",", cursor, end)
+        if comma < 0:
+            comma = end
+        colon = line.find(":", cursor, comma)
+        # Pairs must contain exactly one ':' separator
+        if colon < 0 or line.find(":", colon + 1, comma) >= 0:
+            cursor = comma + 1
+            continue
+
+        key = line[cursor:colon].strip()
+        val = line[colon + 1 : comma].strip()
+        cursor = comma + 1
+
+        # Convert MB values to float
+        if "MB" in val:
+            try:
+                val = float(val.replace("MB", "").strip())
+                key = key + "_MB"
+            except ValueError:
+                print(f"Warning: Could not parse MB value: {val}", file=sys.stderr)
+                continue
+        elif key == "numBanks":
+            try:
+                val = int(val)
+            except ValueError:
+                print(
+                    f"Warning: Could not parse numBanks value: {val}",
+                    file=sys.stderr,
+                )
+                continue
+
+        stats[key] = val
 
     return stats if stats else None
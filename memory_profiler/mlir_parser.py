@@ -6,6 +6,8 @@
 MLIR operation parser for extracting operation details from runtime logs.
 """
 
+import functools
+import math
 import re
 import sys
 from typing import Dict, List, Optional, Tuple
@@ -32,7 +34,34 @@ DTYPE_SIZES = {
     "bool": 1,
 }
 
-
+# Tensor type patterns
+_TENSOR_HEAD_RE = re.compile(r"tensor<([\dx]+[a-zA-Z]\w*)")
+_SHAPE_DTYPE_RE = re.compile(r"^((?:\d+x)*\d+)x([a-zA-Z]\w*)$")
+_SCALAR_DTYPE_RE = re.compile(r"^[a-zA-Z]\w*$")
+_MEMREF_RE = re.compile(r"memref<([\dx]+)x!(?:ttcore|tt)\.tile<(\d+)x(\d+),\s*(\w+)>")
+_BUFFER_TYPE_RE = re.compile(r"#ttnn\.buffer_type<(\w+)>")
+
+# Operation line patterns
+_OP_WITH_RESULT_RE = re.compile(r'(%\d+)\s*=\s*"?([\w.]+)"?\(([^)]*)\)')
+_OP_NO_RESULT_RE = re.compile(r'"?([\w.]+)"?\(([^)]*)\)')
+_ATTRS_RE = re.compile(r"<\{([^}]+)\}>")
+_LOC_RE = re.compile(r'loc\("([^"]+)"')
+_LOAD_CACHED_FUNC_RE = re.compile(r"load_cached\((@[\w.]+)")
+_TYPE_SIG_WITH_ATTRS_RE = re.compile(r"\}>\s*:\s*(.+)\s+loc\(")
+_TYPE_SIG_NO_ATTRS_RE = re.compile(r"[)>]\s*:\s*(.+)\s+loc\(")
+_TYPE_SIG_START_RE = re.compile(r"[)>]\s*:")
+# Everything after the operand list in one sweep: optional attributes, the
+# type signature and the (quoted) location of the last ' loc('
+_OP_TAIL_RE = re.compile(
+    r'\s*(?:<\{(?P<attrs>[^}]+)\}>\s*)?:\s*(?P<sig>.+)\s+loc\((?:"(?P<loc>[^"]+)")?'
+)
+
+
+# Tensor type strings repeat heavily across a log (every producer, consumer
+# and deallocate of a tensor), so the pure parsing helpers are memoized. The
+# extracted shapes, dtypes, buffer types and op names come from a small set
+# and are interned so every parsed op shares one copy of each.
+@functools.lru_cache(maxsize=4096)
 def parse_tensor_type(type_str: str) -> Tuple[Optional[str], Optional[str]]:
     """
     Extract shape and dtype from a tensor type string.
@@ -51,23 +80,58 @@ def parse_tensor_type(type_str: str) -> Tuple[Optional[str], Optional[str]]:
     if not type_str:
         return None, None
 
+    # Fast path for the common well-formed case: slice the body out of
+    # tensor<...> (or take the bare string) and split off the dtype at the
+    # last 'x'. Anything unusual falls through to the regexes below.
+    if type_str.startswith("tensor<"):
+        body = type_str[len("tensor<"):].partition(">")[0].partition(",")[0]
+    elif "tensor<" not in type_str:
+        body = type_str.strip()
+    else:
+        body = ""
+    shape, sep, dtype = body.rpartition("x")
+    if dtype in DTYPE_SIZES:
+        if sep:
+            if shape and all(d.isdecimal() for d in shape.split("x")):
+                return sys.intern(shape), sys.intern(dtype)
+        elif not type_str.startswith("tensor<"):
+            # Bare scalar dtype such as "f32"
+            return None, sys.intern(dtype)
+
     # Extract the shape and dtype part from tensor<shape_dtype, ...> or tensor<shape_dtype>
     # The shape/dtype is always at the beginning, before any comma or '>'
-    tensor_match = re.search(r"tensor<([\dx]+[a-zA-Z]\w*)", type_str)
+    tensor_match = _TENSOR_HEAD_RE.search(type_str)
     if tensor_match:
         inner = tensor_match.group(1)
     else:
         inner = type_str.strip()
 
+    return _split_shape_dtype(inner)
+
+
+def _split_shape_dtype(inner: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Split a tensor body such as '1x2x3xf32' into shape and dtype.
+
+    Args:
+        inner: Shape and dtype without the surrounding tensor<...>
+
+    Returns:
+        Tuple of (shape, dtype) e.g., ('1x2x3', 'f32')
+    """
+    shape, sep, dtype = inner.rpartition("x")
+    if sep and dtype in DTYPE_SIZES and shape and all(d.isdecimal() for d in shape.split("x")):
+        return sys.intern(shape), sys.intern(dtype)
+
     # Match dimensions and dtype: e.g., "1x2x3xf32" or "1x2x3xbf16" or "768xbf16"
     # Dimensions are numbers separated by 'x', dtype is letters/numbers at the end
-    match = re.match(r"^((?:\d+x)*\d+)x([a-zA-Z]\w*)$", inner)
+    match = _SHAPE_DTYPE_RE.match(inner)
     if match:
-        return match.group(1), match.group(2)
+        return sys.intern(match.group(1)), sys.intern(match.group(2))
 
     # Handle scalar types like just "f32"
-    if re.match(r"^[a-zA-Z]\w*$", inner):
-        return None, inner
+    if _SCALAR_DTYPE_RE.match(inner):
+        return None, sys.intern(inner)
 
     return None, None
 
@@ -82,32 +146,57 @@ def parse_tensor_layout_info(type_str: str) -> Optional[Dict]:
 
     Returns:
         {
-            "logical_shape": [64, 128],
+            "logical_shape": (64, 128),
             "dtype": "f32",
             "is_tiled": True,
-            "memref_shape": [2, 4],  # Number of tiles
-            "tile_size": [32, 32],
-            "padded_shape": [64, 128],  # memref * tile_size
+            "memref_shape": (2, 4),  # Number of tiles
+            "tile_size": (32, 32),
+            "padded_shape": (64, 128),  # memref * tile_size
             "buffer_type": "dram",
             "unpadded_bytes": 32768,  # 64*128*4
             "padded_bytes": 32768,    # 64*128*4 (no overhead here)
             "overhead_pct": 0.0
         }
-        Returns None if parsing fails.
+        Returns None if parsing fails. Each call returns a new dict; the
+        shapes are tuples and serialize to JSON as lists.
     """
+    info = _parse_tensor_layout_info(type_str)
+    return dict(info) if info is not None else None
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_tensor_layout_info(type_str: str) -> Optional[Dict]:
+    """Memoized implementation of parse_tensor_layout_info()."""
     if not type_str:
         return None
 
-    result = {}
-
     # Extract logical shape and dtype from tensor<NxMx...dtype, ...>
     shape_str, dtype = parse_tensor_type(type_str)
+    return _build_layout_info(type_str, shape_str, dtype)
+
+
+def _build_layout_info(
+    type_str: str, shape_str: Optional[str], dtype: Optional[str]
+) -> Optional[Dict]:
+    """
+    Build the layout info dict for a tensor type string.
+
+    Args:
+        type_str: Tensor type string
+        shape_str: Logical shape already extracted from type_str
+        dtype: Dtype already extracted from type_str
+
+    Returns:
+        Layout info dict as described in parse_tensor_layout_info(), or None
+    """
     if not shape_str or not dtype:
         return None
 
+    result = {}
+
     # Parse logical shape dimensions
     try:
-        logical_shape = [int(d) for d in shape_str.split("x")]
+        logical_shape = tuple(map(int, shape_str.split("x")))
     except ValueError:
         return None
 
@@ -118,16 +207,13 @@ def parse_tensor_layout_info(type_str: str) -> Optional[Dict]:
     dtype_size = DTYPE_SIZES.get(dtype, 4)
 
     # Calculate unpadded bytes
-    unpadded_elements = 1
-    for d in logical_shape:
-        unpadded_elements *= d
-    result["unpadded_bytes"] = unpadded_elements * dtype_size
+    result["unpadded_bytes"] = math.prod(logical_shape) * dtype_size
 
     # Check if this is a tiled layout by looking for memref and tile patterns
     # Pattern: memref<AxBx!ttcore.tile<H,W, dtype>...> or memref<AxBx!tt.tile<H,W, dtype>...>
-    memref_match = re.search(
-        r"memref<([\dx]+)x!(?:ttcore|tt)\.tile<(\d+)x(\d+),\s*(\w+)>", type_str
-    )
+    # Row-major and scalar layouts carry no tile memref, so a substring check
+    # skips the regex for them
+    memref_match = _MEMREF_RE.search(type_str) if ".tile<" in type_str else None
 
     if memref_match:
         result["is_tiled"] = True
@@ -139,52 +225,51 @@ def parse_tensor_layout_info(type_str: str) -> Optional[Dict]:
         memref_dtype = memref_match.group(4)
 
         try:
-            memref_shape = [int(d) for d in memref_shape_str.split("x")]
+            memref_shape = tuple(map(int, memref_shape_str.split("x")))
         except ValueError:
-            memref_shape = []
+            memref_shape = ()
 
         result["memref_shape"] = memref_shape
-        result["tile_size"] = [tile_h, tile_w]
+        result["tile_size"] = (tile_h, tile_w)
 
         # Calculate padded shape: for each tile dimension, multiply by tile size
         # The physical shape is memref_shape * tile_size for the last two dims
         # For 1D tensors: memref is 1xN tiles of 32x32, so padded is 32 x (N*32)
         if len(memref_shape) >= 2:
             # Last two memref dims correspond to tile grid
-            padded_shape = memref_shape[:-2] + [
+            padded_shape = memref_shape[:-2] + (
                 memref_shape[-2] * tile_h,
                 memref_shape[-1] * tile_w,
-            ]
+            )
         elif len(memref_shape) == 1:
             # Single dim - interpret as Nx1 tile grid
-            padded_shape = [tile_h, memref_shape[0] * tile_w]
+            padded_shape = (tile_h, memref_shape[0] * tile_w)
         else:
-            padded_shape = [tile_h, tile_w]
+            padded_shape = (tile_h, tile_w)
 
         result["padded_shape"] = padded_shape
 
         # Calculate padded bytes
-        padded_elements = 1
-        for d in padded_shape:
-            padded_elements *= d
-        result["padded_bytes"] = padded_elements * dtype_size
+        result["padded_bytes"] = math.prod(padded_shape) * dtype_size
     else:
         # Not a tiled layout (row-major or scalar)
         result["is_tiled"] = False
         result["memref_shape"] = None
         result["tile_size"] = None
-        result["padded_shape"] = logical_shape.copy()
+        # Shapes are immutable tuples, so the logical shape can be shared
+        result["padded_shape"] = logical_shape
         result["padded_bytes"] = result["unpadded_bytes"]
 
     # Extract buffer type from #ttnn.buffer_type<...>
-    buffer_match = re.search(r"#ttnn\.buffer_type<(\w+)>", type_str)
+    buffer_match = _BUFFER_TYPE_RE.search(type_str) if "buffer_type<" in type_str else None
     if buffer_match:
-        result["buffer_type"] = buffer_match.group(1).lower()
+        result["buffer_type"] = sys.intern(buffer_match.group(1).lower())
     else:
         result["buffer_type"] = None
 
-    # Calculate overhead percentage
-    if result["padded_bytes"] > 0:
+    # Calculate overhead percentage (always zero for row-major layouts,
+    # whose padded shape is the logical shape)
+    if result["is_tiled"] and result["padded_bytes"] > 0:
         overhead_bytes = result["padded_bytes"] - result["unpadded_bytes"]
         result["overhead_pct"] = (overhead_bytes / result["unpadded_bytes"]) * 100
     else:
@@ -206,17 +291,44 @@ def parse_type_string(type_str: str) -> List[Dict]:
     Returns:
         List of dicts with 'shape' and 'dtype' keys
     """
+    return [{"shape": shape, "dtype": dtype} for shape, dtype in _parse_type_tuples(type_str)]
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_type_tuples(type_str: str) -> Tuple[Tuple[Optional[str], Optional[str]], ...]:
+    """Memoized parse_type_string() returning immutable (shape, dtype) pairs."""
     if not type_str:
-        return []
+        return ()
 
-    results = []
     # Find all tensor< patterns and extract shape/dtype
-    # Pattern matches 'tensor<' followed by dimensions and dtype
-    for match in re.finditer(r"tensor<([\dx]+[a-zA-Z]\w*)", type_str):
-        shape, dtype = parse_tensor_type(f"tensor<{match.group(1)}>")
-        results.append({"shape": shape, "dtype": dtype})
+    # Pattern matches 'tensor<' followed by dimensions and dtype; the
+    # captured body is split directly rather than re-wrapped in tensor<...>
+    # and parsed again
+    return tuple(_split_shape_dtype(match.group(1)) for match in _TENSOR_HEAD_RE.finditer(type_str))
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_output_type(
+    type_str: Optional[str],
+) -> Tuple[Tuple[Tuple[Optional[str], Optional[str]], ...], Optional[Dict]]:
+    """
+    Parse an output type string into its (shape, dtype) pairs and layout info.
+
+    The layout's logical shape and dtype are those of the first tensor in
+    the string, so they are reused from the pairs instead of parsing the
+    string a second time.
 
-    return results
+    Args:
+        type_str: Output type string of an MLIR operation
+
+    Returns:
+        Tuple of (shape/dtype pairs, shared layout info dict or None)
+    """
+    tensors = _parse_type_tuples(type_str)
+    if not type_str:
+        return tensors, None
+    shape_str, dtype = tensors[0] if tensors else parse_tensor_type(type_str)
+    return tensors, _build_layout_info(type_str, shape_str, dtype)
 
 
 def find_top_level_arrow(s: str) -> int:
@@ -232,30 +344,100 @@ def find_top_level_arrow(s: str) -> int:
     Returns:
         Position of the top-level ' -> ', or -1 if not found
     """
+    # Only candidate ' -> ' positions are checked; the bracket depth at each
+    # is computed with C-level str.count over the text since the previous
+    # candidate, instead of stepping through every character in Python.
+    # A '>' that is part of '->' does not close an angle bracket.
     depth_angle = 0
     depth_paren = 0
-    i = 0
-    while i < len(s) - 3:
-        c = s[i]
-        if c == "<":
-            depth_angle += 1
-        elif c == ">":
-            # Don't count '>' that's part of '->'
-            if i > 0 and s[i - 1] == "-":
-                pass  # Skip, this is part of '->'
-            else:
-                depth_angle -= 1
-        elif c == "(":
-            depth_paren += 1
-        elif c == ")":
-            depth_paren -= 1
-
-        if depth_angle == 0 and depth_paren == 0 and s[i : i + 4] == " -> ":
-            return i
-        i += 1
+    start = 0
+    pos = s.find(" -> ")
+    while pos >= 0:
+        depth_angle += (
+            s.count("<", start, pos) - s.count(">", start, pos) + s.count("->", start, pos)
+        )
+        depth_paren += s.count("(", start, pos) - s.count(")", start, pos)
+        if depth_angle == 0 and depth_paren == 0:
+            return pos
+        start = pos
+        pos = s.find(" -> ", pos + 1)
     return -1
 
 
+def _match_op_tail(line: str, end: int) -> Optional[Tuple[Optional[str], str, Optional[str]]]:
+    """
+    Extract attributes, type signature and location with a single regex sweep.
+
+    The sweep starts right after the operand list. Its result is only used
+    when it provably agrees with the independent searches in _search_op_tail
+    (no '<{', '}>' or type-signature start earlier in the line), otherwise
+    None is returned and the caller falls back.
+
+    Args:
+        line: Log line containing MLIR operation
+        end: Index just past the operand list's closing parenthesis
+
+    Returns:
+        Tuple of (attributes, type_sig, location), or None to fall back
+    """
+    # Without a loc( the greedy signature group would scan to the end of the
+    # line and back for nothing
+    if "loc(" not in line:
+        return None
+    tail = _OP_TAIL_RE.match(line, end)
+    if tail is None:
+        return None
+    attributes = tail.group("attrs")
+    if attributes is None:
+        # A '}>' anywhere would let the with-attributes searches match elsewhere
+        if "}>" in line:
+            return None
+        if _TYPE_SIG_START_RE.search(line, 0, end) is not None:
+            return None
+    elif line.find("<{", 0, end) != -1 or line.find("}>", 0, end) != -1:
+        return None
+
+    # The sweep captures the last loc(...), the independent search the first
+    location = tail.group("loc")
+    if location is None or line.find('loc("') != tail.start("loc") - 5:
+        loc_match = _LOC_RE.search(line)
+        location = loc_match.group(1) if loc_match else None
+    return attributes, tail.group("sig"), location
+
+
+def _search_op_tail(line: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """
+    Extract attributes, type signature and location with independent searches.
+
+    Args:
+        line: Log line containing MLIR operation
+
+    Returns:
+        Tuple of (attributes, type_sig, location); missing parts are None
+    """
+    # Extract attributes (e.g., <{dtype = #ttcore.supportedDataTypes<f32>}>)
+    attrs_match = _ATTRS_RE.search(line)
+    attributes = attrs_match.group(1) if attrs_match else None
+
+    # Extract location (e.g., loc("convert.80") or loc("reduce.864_mean"("reduce.864")))
+    loc_match = _LOC_RE.search(line)
+    location = loc_match.group(1) if loc_match else None
+
+    # Strategy: Find the type signature between "}> :" and " loc("
+    # Both patterns need a loc(; checking for it first avoids the greedy
+    # (.+) backtracking from every candidate start on lines without one
+    if "loc(" not in line:
+        return attributes, None, location
+    # Try pattern with attributes first: }> : ... loc(
+    type_sig_match = _TYPE_SIG_WITH_ATTRS_RE.search(line)
+    if not type_sig_match:
+        # Try pattern without attributes: ) : ... loc(  or > : ... loc(
+        type_sig_match = _TYPE_SIG_NO_ATTRS_RE.search(line)
+    type_sig = type_sig_match.group(1) if type_sig_match else None
+
+    return attributes, type_sig, location
+
+
 def parse_mlir_operation(line: str) -> Optional[Dict]:
     """
     Extract MLIR operation details from a log line.
@@ -270,55 +452,55 @@ def parse_mlir_operation(line: str) -> Optional[Dict]:
     Returns:
         Dictionary with operation details, or None if parsing fails
     """
+    # Both operation patterns need an operand list; banner, module and blank
+    # lines are rejected without running either regex
+    if "(" not in line:
+        return None
+
     # Extract operation with result variable
     # Handles both quoted ("ttnn.typecast") and unquoted (ttcore.load_cached) operations
     # Pattern: %N = "op.name"(...) or %N = op.name(...)
-    match = re.search(r'(%\d+)\s*=\s*"?([\w.]+)"?\(([^)]*)\)', line)
+    match = _OP_WITH_RESULT_RE.search(line)
 
     if not match:
         # Handle operations without result (like deallocate)
         # Pattern: "op.name"(...) or op.name(...)
-        match = re.search(r'"?([\w.]+)"?\(([^)]*)\)', line)
+        match = _OP_NO_RESULT_RE.search(line)
         if not match:
             return None
         result = None
-        mlir_op = match.group(1)
+        mlir_op = sys.intern(match.group(1))
         inputs = match.group(2)
     else:
         result = match.group(1)
-        mlir_op = match.group(2)
+        mlir_op = sys.intern(match.group(2))
         inputs = match.group(3)
 
-    # Extract attributes (e.g., <{dtype = #ttcore.supportedDataTypes<f32>}>)
-    attrs_match = re.search(r"<\{([^}]+)\}>", line)
-    attributes = attrs_match.group(1) if attrs_match else None
-
-    # Extract location (e.g., loc("convert.80") or loc("reduce.864_mean"("reduce.864")))
-    loc_match = re.search(r'loc\("([^"]+)"', line)
-    location = loc_match.group(1) if loc_match else None
+    tail = _match_op_tail(line, match.end())
+    if tail is not None:
+        attributes, type_sig, location = tail
+    else:
+        attributes, type_sig, location = _search_op_tail(line)
+    # Attributes and locations recur for every repeated execution of an op
+    if attributes is not None:
+        attributes = sys.intern(attributes)
+    if location is not None:
+        location = sys.intern(location)
 
     # Fallback for load_cached ops with loc(unknown): use @function_name as synthetic location
     if location is None and "load_cached" in line:
-        func_match = re.search(r'load_cached\((@[\w.]+)', line)
+        func_match = _LOAD_CACHED_FUNC_RE.search(line)
         if func_match:
             location = func_match.group(1)  # e.g., "@main_const_eval_0"
 
-    # Extract type signatures
+    # Split the type signature into input and output types
     # Format: : (input_types) -> output_type loc(...)
     # Need to handle nested parentheses in ttnn layouts like:
     #   tensor<768xbf16, #ttnn.ttnn_layout<(d0) -> (0, d0), ...>>
-    # Strategy: Find the type signature between "}> :" and " loc("
     input_types_str = None
     output_type_str = None
 
-    # Try pattern with attributes first: }> : ... loc(
-    type_sig_match = re.search(r"\}>\s*:\s*(.+)\s+loc\(", line)
-    if not type_sig_match:
-        # Try pattern without attributes: ) : ... loc(  or > : ... loc(
-        type_sig_match = re.search(r"[)>]\s*:\s*(.+)\s+loc\(", line)
-
-    if type_sig_match:
-        type_sig = type_sig_match.group(1)
+    if type_sig is not None:
         # Split on " -> " to separate input and output types
         # But need to be careful of " -> " inside layouts
         # Find the last " -> " that's not inside angle brackets
@@ -329,6 +511,9 @@ def parse_mlir_operation(line: str) -> Optional[Dict]:
             # Remove outer parentheses from input types if present
             if input_types_str.startswith("(") and input_types_str.endswith(")"):
                 input_types_str = input_types_str[1:-1]
+            # The (long) type strings repeat across ops of the same shape
+            input_types_str = sys.intern(input_types_str)
+            output_type_str = sys.intern(output_type_str)
 
     # Parse input operands into a list
     input_list = []
@@ -337,11 +522,11 @@ def parse_mlir_operation(line: str) -> Optional[Dict]:
         input_list = [i.strip() for i in inputs.split(",") if i.strip()]
 
     # Parse input and output types to extract shapes and dtypes
-    input_tensors = parse_type_string(input_types_str)
-    output_tensors = parse_type_string(output_type_str)
-
-    # Parse output layout info for unpadded memory analysis
-    output_layout_info = parse_tensor_layout_info(output_type_str)
+    # Output layout info is used for unpadded memory analysis
+    input_tensors = _parse_type_tuples(input_types_str)
+    output_tensors, output_layout_info = _parse_output_type(output_type_str)
+    if output_layout_info is not None:
+        output_layout_info = dict(output_layout_info)
 
     return {
         "result": result,
@@ -350,10 +535,10 @@ def parse_mlir_operation(line: str) -> Optional[Dict]:
         "attributes": attributes,
         "input_types": input_types_str,
         "output_type": output_type_str,
-        "input_shapes": [t["shape"] for t in input_tensors],
-        "input_dtypes": [t["dtype"] for t in input_tensors],
-        "output_shapes": [t["shape"] for t in output_tensors],
-        "output_dtypes": [t["dtype"] for t in output_tensors],
+        "input_shapes": [shape for shape, _ in input_tensors],
+        "input_dtypes": [dtype for _, dtype in input_tensors],
+        "output_shapes": [shape for shape, _ in output_tensors],
+        "output_dtypes": [dtype for _, dtype in output_tensors],
         "output_layout_info": output_layout_info,
         "loc": location,
     }
@@ -6,24 +6,117 @@
 Main log parser for extracting operation and memory statistics from runtime logs.
 """
 
+import contextlib
+import io
 import json
 import re
 import sys
-from typing import Dict, List, Optional
+import time
+from collections import deque
+from itertools import islice
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Tuple
 
 # Handle both package import and direct execution
 try:
+    from ._json_compat import load_json, orjson
     from .inputs_registry_parser import parse_inputs_registry
     from .ir_parser import parse_ir_modules
     from .memory_parser import parse_memory_stats
     from .mlir_parser import parse_mlir_operation
 except ImportError:
+    from _json_compat import load_json, orjson
     from inputs_registry_parser import parse_inputs_registry
     from ir_parser import parse_ir_modules
     from memory_parser import parse_memory_stats
     from mlir_parser import parse_mlir_operation
 
 
+_CACHE_MISS_RE = re.compile(r"Cache miss or invalid cache for function:\s*(\S+)")
+_PROGRAM_START_RE = re.compile(r"Starting execution of program:\s*(\S+)")
+_PROGRAM_FINISH_RE = re.compile(r"Finished execution of program:\s*(\S+)")
+
+# Lines after an operation line that parse_memory_stats() may read: the
+# memory state header and the DRAM, L1, L1_SMALL and TRACE lines
+_MEMORY_STATS_LOOKAHEAD = 5
+_READ_BUFFER_SIZE = 1 << 20
+# Running memory totals key of each normalized buffer type
+_TOTALS_KEY_BY_BUFFER_TYPE = {"dram": "DRAM", "l1": "L1"}
+# const_eval fields of operations executed outside any const_eval graph
+_NO_CONST_EVAL_FIELDS = {
+    "const_eval_graph": None,
+    "const_eval_cache_miss": False,
+    "is_weight_op": False,
+}
+# Seconds to wait for a followed log to grow before reading it again
+_FOLLOW_POLL_INTERVAL = 0.1
+
+
+def _iter_with_lookahead(lines: Iterable[str], lookahead: int) -> Iterator[Deque[str]]:
+    """
+    Iterate over lines, yielding a window of the current line and those after it.
+
+    Args:
+        lines: Line iterator, e.g. an open text file
+        lookahead: Number of lines after the current one to keep in the window
+
+    Returns:
+        Iterator over deques whose first item is the current line. The same
+        deque is reused between steps.
+    """
+    lines = iter(lines)
+    window = deque(islice(lines, lookahead + 1))
+    while window:
+        yield window
+        window.popleft()
+        window.extend(islice(lines, 1))
+
+
+def follow_log_lines(
+    log_path: str, finished, poll_interval: float = _FOLLOW_POLL_INTERVAL
+) -> Iterator[str]:
+    """
+    Iterate over the lines of a log file that is still being written.
+
+    Only complete lines are yielded while the log grows. Once finished is
+    set, the rest of the file is read and iteration stops at its end.
+
+    Args:
+        log_path: Path to the log file, which need not exist yet
+        finished: Event (threading or multiprocessing) set once the writer
+            has closed the log
+        poll_interval: Seconds to sleep when no new data is available
+
+    Returns:
+        Iterator over the log lines, including line endings
+    """
+    while True:
+        try:
+            log_file = open(log_path, "r", encoding="utf-8", errors="replace")
+            break
+        except FileNotFoundError:
+            if finished.is_set():
+                return
+            time.sleep(poll_interval)
+
+    with log_file:
+        pending = ""
+        while True:
+            line = log_file.readline()
+            if line:
+                # A line without its newline is still being written
+                if not line.endswith("\n"):
+                    pending += line
+                    continue
+                yield pending + line
+                pending = ""
+            elif finished.is_set():
+                # The writer is done, so whatever is left is final
+                yield from io.StringIO(pending + log_file.read())
+                return
+            else:
+                time.sleep(poll_interval)
+
+
 def calculate_unpadded_memory_state(live_tensors: Dict[str, Dict]) -> Dict:
     """
     Calculate total unpadded vs padded memory from all live tensors.
@@ -35,7 +128,15 @@ def calculate_unpadded_memory_state(live_tensors: Dict[str, Dict]) -> Dict:
         Dict with DRAM and L1 memory states including unpadded/padded bytes,
         MB values, overhead, and tensor counts.
     """
-    result = {
+    totals = _new_memory_totals()
+    for layout in live_tensors.values():
+        _update_memory_totals(totals, layout, 1)
+    return _memory_state_from_totals(totals)
+
+
+def _new_memory_totals() -> Dict[str, Dict[str, int]]:
+    """Return zeroed running byte and tensor totals for DRAM and L1."""
+    return {
         "DRAM": {
             "unpadded_bytes": 0,
             "padded_bytes": 0,
@@ -48,37 +149,165 @@ def calculate_unpadded_memory_state(live_tensors: Dict[str, Dict]) -> Dict:
         },
     }
 
-    for ssa, layout in live_tensors.items():
-        buf_type = layout.get("buffer_type", "")
-        if buf_type:
+
+def _update_memory_totals(totals: Dict[str, Dict[str, int]], layout: Dict, sign: int) -> None:
+    """
+    Add (sign=1) or remove (sign=-1) one live tensor from the running totals.
+
+    Args:
+        totals: Running totals from _new_memory_totals()
+        layout: layout_info dict of the tensor
+        sign: 1 when the tensor becomes live, -1 when it is freed
+    """
+    buf_type = layout.get("buffer_type", "")
+    if buf_type:
+        # Layouts from the MLIR parser carry lower-case buffer types, which
+        # map straight to their totals key without upper-casing
+        buf_type_upper = _TOTALS_KEY_BY_BUFFER_TYPE.get(buf_type)
+        if buf_type_upper is None:
             buf_type_upper = buf_type.upper()
-            if buf_type_upper in result:
-                result[buf_type_upper]["unpadded_bytes"] += layout.get(
-                    "unpadded_bytes", 0
-                )
-                result[buf_type_upper]["padded_bytes"] += layout.get("padded_bytes", 0)
-                result[buf_type_upper]["num_tensors"] += 1
+        if buf_type_upper in totals:
+            t = totals[buf_type_upper]
+            t["unpadded_bytes"] += sign * layout.get("unpadded_bytes", 0)
+            t["padded_bytes"] += sign * layout.get("padded_bytes", 0)
+            t["num_tensors"] += sign
+
+
+def _memory_state_from_totals(totals: Dict[str, Dict[str, int]]) -> Dict:
+    """
+    Build the unpadded memory state for the current running totals.
+
+    Args:
+        totals: Running totals from _new_memory_totals()
 
+    Returns:
+        Dict in the format returned by calculate_unpadded_memory_state()
+    """
+    result = {}
     # Convert to MB and calculate overhead
-    for mem_type in result:
-        r = result[mem_type]
+    for mem_type, t in totals.items():
+        r = dict(t)
         r["unpadded_MB"] = r["unpadded_bytes"] / (1024 * 1024)
         r["padded_MB"] = r["padded_bytes"] / (1024 * 1024)
         r["overhead_MB"] = r["padded_MB"] - r["unpadded_MB"]
         r["overhead_pct"] = (
             (r["overhead_MB"] / r["unpadded_MB"] * 100) if r["unpadded_MB"] > 0 else 0
         )
+        result[mem_type] = r
 
     return result
 
 
+class _MemoryStateSnapshot:
+    """
+    Compact snapshot of the running DRAM/L1 totals at one operation.
+
+    Consecutive operations that neither allocate nor free a tracked tensor
+    share one snapshot; the nested unpadded memory dict is only built while
+    the memory JSON is written (see _json_default).
+    """
+
+    __slots__ = ("totals",)
+
+    def __init__(self, totals: Tuple[int, ...]):
+        self.totals = totals
+
+    def as_dict(self) -> Dict:
+        """Return the unpadded memory state in calculate_unpadded_memory_state() format."""
+        dram_unpadded, dram_padded, dram_n, l1_unpadded, l1_padded, l1_n = self.totals
+        return _memory_state_from_totals(
+            {
+                "DRAM": {
+                    "unpadded_bytes": dram_unpadded,
+                    "padded_bytes": dram_padded,
+                    "num_tensors": dram_n,
+                },
+                "L1": {
+                    "unpadded_bytes": l1_unpadded,
+                    "padded_bytes": l1_padded,
+                    "num_tensors": l1_n,
+                },
+            }
+        )
+
+
+def _json_default(obj):
+    """JSON encoder hook that expands memory state snapshots while writing."""
+    if isinstance(obj, _MemoryStateSnapshot):
+        return obj.as_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _write_json(path: str, data) -> None:
+    """
+    Write data as indented JSON, using orjson when it is installed.
+
+    Args:
+        path: Output file path
+        data: JSON-serializable data (may contain memory state snapshots)
+    """
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, default=_json_default, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, default=_json_default)
+
+
+def _propagate_derived_weights(
+    op_pos: int,
+    op_info: Dict,
+    load_cached_idx: Optional[int],
+    derived_weights: Dict[Tuple[str, Optional[int], str], List[Dict]],
+    op_weight_indices: Dict[int, set],
+    missed_keys: set,
+) -> None:
+    """
+    Propagate derived weights into a const_eval operation and register its output.
+
+    Args:
+        op_pos: Position of the operation in the operations list
+        op_info: The const_eval operation
+        load_cached_idx: Index of the load_cached operation that invoked the graph
+        derived_weights: Weights of derived SSA values, keyed by
+            (const_eval_graph, load_cached_idx, ssa)
+        op_weight_indices: registry_index values already in each op's weights
+        missed_keys: Collects input keys that were not registered yet
+    """
+    # Use load_cached index to scope derived weights
+    const_eval_graph = op_info["const_eval_graph"]
+
+    # Check if any input is a derived weight (within same const_eval invocation)
+    for inp in op_info.get("inputs", []):
+        key = (const_eval_graph, load_cached_idx, inp)
+        if key in derived_weights:
+            seen_indices = op_weight_indices.get(op_pos)
+            if seen_indices is None:
+                seen_indices = op_weight_indices[op_pos] = {
+                    w.get("registry_index") for w in op_info["weights"]
+                }
+            for dw in derived_weights[key]:
+                if dw.get("registry_index") not in seen_indices:
+                    seen_indices.add(dw.get("registry_index"))
+                    op_info["weights"].append(dw.copy())
+        else:
+            missed_keys.add(key)
+
+    # If this operation has weights, register its output as derived
+    if op_info["weights"] and op_info.get("result"):
+        key = (const_eval_graph, load_cached_idx, op_info["result"])
+        if key not in derived_weights:
+            derived_weights[key] = op_info["weights"].copy()
+
+
 def parse_log_file(
     log_path: str,
     mem_output: str,
     ops_output: str,
     registry_output: Optional[str] = None,
     ir_output: Optional[str] = None,
-) -> None:
+    lines: Optional[Iterable[str]] = None,
+) -> Optional[Tuple[List[Dict], List[Dict]]]:
     """
     Parse log file and generate synchronized JSON outputs.
 
@@ -88,21 +317,37 @@ def parse_log_file(
         ops_output: Path for operation details JSON output
         registry_output: Optional path for inputs registry JSON output
         ir_output: Optional path for IR modules JSON output (TTIR/TTNN)
+        lines: Optional iterable of the log's lines, e.g. follow_log_lines()
+            while the log is still being written; log_path is read directly
+            if omitted. The registry and IR outputs always re-read log_path.
+
+    Returns:
+        Tuple of (memory_stats, operations) holding the data written to
+        mem_output and ops_output. The "unpadded_memory" entries are internal snapshot objects that are
+        expanded to dicts only when serialized. None if the log could not
+        be read or either output could not be written
     """
     operations = []
     memory_stats = []
+    # Per-operation load_cached flag, parallel to operations, so the weight
+    # passes do not re-scan each op name
+    op_is_load_cached: List[bool] = []
 
-    try:
-        with open(log_path, "r", encoding="utf-8", errors="replace") as f:
-            lines = f.readlines()
-    except FileNotFoundError:
-        print(f"Error: Log file not found: {log_path}", file=sys.stderr)
-        return
-    except Exception as e:
-        print(f"Error reading log file: {e}", file=sys.stderr)
-        return
+    if lines is not None:
+        log_file = contextlib.nullcontext(lines)
+    else:
+        try:
+            log_file = open(
+                log_path, "r", encoding="utf-8", errors="replace", buffering=_READ_BUFFER_SIZE
+            )
+        except FileNotFoundError:
+            print(f"Error: Log file not found: {log_path}", file=sys.stderr)
+            return None
+        except Exception as e:
+            print(f"Error reading log file: {e}", file=sys.stderr)
+            return None
 
-    i = 0
+    line_count = 0
     op_index = 0
     skipped_ops = 0
     deallocate_count = 0
@@ -116,147 +361,179 @@ def parse_log_file(
     # Track live tensors by SSA name for unpadded memory analysis
     # Key: SSA name (e.g., "%0"), Value: layout_info dict
     live_tensors: Dict[str, Dict] = {}
+    # Byte and tensor totals of live_tensors, updated as tensors come and go
+    live_totals = _new_memory_totals()
+    last_snapshot: Optional[_MemoryStateSnapshot] = None
+
+    # Stream the log; the window holds the current line plus the few lines
+    # after it that the memory stats lookahead needs
+    with log_file as log_lines:
+        for i, window in enumerate(_iter_with_lookahead(log_lines, _MEMORY_STATS_LOOKAHEAD)):
+            line = window[0]
+            line_count += 1
+
+            # Most lines carry none of the markers below, so a substring test
+            # gates each regex search
+
+            # Check for const_eval cache miss
+            cache_miss_match = _CACHE_MISS_RE.search(line) if "Cache miss" in line else None
+            if cache_miss_match:
+                func_name = sys.intern(cache_miss_match.group(1))
+                const_eval_cache_misses.add(func_name)
+
+            # Check for starting execution of a const_eval program
+            start_match = (
+                _PROGRAM_START_RE.search(line) if "Starting execution" in line else None
+            )
+            if start_match:
+                # Interned so every op of a graph shares one const_eval_graph string
+                program_name = sys.intern(start_match.group(1))
+                if "const_eval" in program_name:
+                    const_eval_stack.append(program_name)
+                    if program_name not in const_eval_ops_count:
+                        const_eval_ops_count[program_name] = 0
+
+            # Check for finishing execution of a const_eval program
+            finish_match = (
+                _PROGRAM_FINISH_RE.search(line) if "Finished execution" in line else None
+            )
+            if finish_match:
+                program_name = finish_match.group(1)
+                if (
+                    "const_eval" in program_name
+                    and const_eval_stack
+                    and const_eval_stack[-1] == program_name
+                ):
+                    const_eval_stack.pop()
+
+            # Check for operation execution line
+            if "Executing operation:" in line and "RuntimeTTNN" in line:
+                op_info = parse_mlir_operation(line)
+
+                if not op_info:
+                    print(
+                        f"Warning: Could not parse operation at line {i+1}", file=sys.stderr
+                    )
+                    skipped_ops += 1
+                    continue
 
-    while i < len(lines):
-        line = lines[i]
-
-        # Check for const_eval cache miss
-        cache_miss_match = re.search(
-            r"Cache miss or invalid cache for function:\s*(\S+)", line
-        )
-        if cache_miss_match:
-            func_name = cache_miss_match.group(1)
-            const_eval_cache_misses.add(func_name)
-
-        # Check for starting execution of a const_eval program
-        start_match = re.search(r"Starting execution of program:\s*(\S+)", line)
-        if start_match:
-            program_name = start_match.group(1)
-            if "const_eval" in program_name:
-                const_eval_stack.append(program_name)
-                if program_name not in const_eval_ops_count:
-                    const_eval_ops_count[program_name] = 0
-
-        # Check for finishing execution of a const_eval program
-        finish_match = re.search(r"Finished execution of program:\s*(\S+)", line)
-        if finish_match:
-            program_name = finish_match.group(1)
-            if (
-                "const_eval" in program_name
-                and const_eval_stack
-                and const_eval_stack[-1] == program_name
-            ):
-                const_eval_stack.pop()
-
-        # Check for operation execution line
-        if "Executing operation:" in line and "RuntimeTTNN" in line:
-            op_info = parse_mlir_operation(line)
-
-            if not op_info:
-                print(
-                    f"Warning: Could not parse operation at line {i+1}", file=sys.stderr
-                )
-                i += 1
-                skipped_ops += 1
-                continue
-
-            # Handle deallocate operations - track deallocation for unpadded analysis
-            if "deallocate" in op_info["mlir_op"]:
-                deallocate_count += 1
-                # Extract deallocated tensor SSA and remove from tracking
-                if op_info.get("inputs"):
-                    deallocated_ssa = op_info["inputs"][0]
-                    if deallocated_ssa in live_tensors:
-                        del live_tensors[deallocated_ssa]
-                i += 1
-                continue
+                # Handle deallocate operations - track deallocation for unpadded analysis
+                if "deallocate" in op_info["mlir_op"]:
+                    deallocate_count += 1
+                    # Extract deallocated tensor SSA and remove from tracking
+                    if op_info.get("inputs"):
+                        deallocated_ssa = op_info["inputs"][0]
+                        if deallocated_ssa in live_tensors:
+                            _update_memory_totals(
+                                live_totals, live_tensors.pop(deallocated_ssa), -1
+                            )
+                    continue
 
-            # Skip get_device operations (no tensor data)
-            if "get_device" in op_info["mlir_op"]:
-                get_device_count += 1
-                i += 1
-                continue
+                # Skip get_device operations (no tensor data)
+                if "get_device" in op_info["mlir_op"]:
+                    get_device_count += 1
+                    continue
 
-            # Look ahead for memory stats (should be on next line)
-            mem_info = parse_memory_stats(lines, i + 1)
-
-            if mem_info:
-                # Add index and cross-reference fields to both outputs
-                op_info["index"] = op_index
-                mem_info["index"] = op_index
-                mem_info["mlir_op"] = op_info["mlir_op"]
-                mem_info["loc"] = op_info["loc"]
-
-                # Add const_eval info if we're inside a const_eval graph
-                # Operations inside const_eval graphs are weight operations since
-                # const_eval only processes parameters and constants
-                if const_eval_stack:
-                    current_const_eval = const_eval_stack[-1]
-                    op_info["const_eval_graph"] = current_const_eval
-                    mem_info["const_eval_graph"] = current_const_eval
-                    # Track if this is a cache miss execution
-                    op_info["const_eval_cache_miss"] = (
-                        current_const_eval in const_eval_cache_misses
+                # Look ahead for memory stats (should be on next line)
+                mem_info = parse_memory_stats(window, 1)
+
+                if mem_info:
+                    # Add index and cross-reference fields to both outputs
+                    op_info["index"] = op_index
+                    mem_info["index"] = op_index
+                    mem_info["mlir_op"] = op_info["mlir_op"]
+                    mem_info["loc"] = op_info["loc"]
+
+                    # Add const_eval info if we're inside a const_eval graph
+                    # Operations inside const_eval graphs are weight operations since
+                    # const_eval only processes parameters and constants
+                    # The same fields go to both outputs, so they are
+                    # collected once and merged into each with dict.update()
+                    if const_eval_stack:
+                        current_const_eval = const_eval_stack[-1]
+                        const_eval_fields = {
+                            "const_eval_graph": current_const_eval,
+                            # Track if this is a cache miss execution
+                            "const_eval_cache_miss": current_const_eval in const_eval_cache_misses,
+                            # All const_eval operations are weight operations
+                            "is_weight_op": True,
+                        }
+                        const_eval_ops_count[current_const_eval] += 1
+                    else:
+                        const_eval_fields = _NO_CONST_EVAL_FIELDS
+                    op_info.update(const_eval_fields)
+                    mem_info.update(const_eval_fields)
+
+                    # Track new tensor allocation from operation output
+                    if op_info.get("result") and op_info.get("output_layout_info"):
+                        layout = op_info["output_layout_info"]
+                        if layout and layout.get("buffer_type") in ("dram", "l1"):
+                            replaced = live_tensors.get(op_info["result"])
+                            if replaced is not None:
+                                _update_memory_totals(live_totals, replaced, -1)
+                            live_tensors[op_info["result"]] = layout
+                            _update_memory_totals(live_totals, layout, 1)
+
+                    # Snapshot the unpadded memory state at this operation
+                    dram, l1 = live_totals["DRAM"], live_totals["L1"]
+                    totals = (
+                        dram["unpadded_bytes"],
+                        dram["padded_bytes"],
+                        dram["num_tensors"],
+                        l1["unpadded_bytes"],
+                        l1["padded_bytes"],
+                        l1["num_tensors"],
                     )
-                    mem_info["const_eval_cache_miss"] = (
-                        current_const_eval in const_eval_cache_misses
-                    )
-                    const_eval_ops_count[current_const_eval] += 1
-                    # All const_eval operations are weight operations
-                    op_info["is_weight_op"] = True
-                    mem_info["is_weight_op"] = True
+                    if last_snapshot is None or last_snapshot.totals != totals:
+                        last_snapshot = _MemoryStateSnapshot(totals)
+                    mem_info["unpadded_memory"] = last_snapshot
+
+                    operations.append(op_info)
+                    memory_stats.append(mem_info)
+                    op_is_load_cached.append("load_cached" in op_info["mlir_op"])
+                    op_index += 1
                 else:
-                    op_info["const_eval_graph"] = None
-                    mem_info["const_eval_graph"] = None
-                    op_info["const_eval_cache_miss"] = False
-                    mem_info["const_eval_cache_miss"] = False
-                    op_info["is_weight_op"] = False
-                    mem_info["is_weight_op"] = False
-
-                # Track new tensor allocation from operation output
-                if op_info.get("result") and op_info.get("output_layout_info"):
-                    layout = op_info["output_layout_info"]
-                    if layout and layout.get("buffer_type") in ("dram", "l1"):
-                        live_tensors[op_info["result"]] = layout
-
-                # Calculate unpadded memory state at this operation
-                unpadded_state = calculate_unpadded_memory_state(live_tensors)
-                mem_info["unpadded_memory"] = unpadded_state
-
-                operations.append(op_info)
-                memory_stats.append(mem_info)
-                op_index += 1
-            else:
-                print(
-                    f"Warning: No memory stats found for operation '{op_info['mlir_op']}' at line {i+1} (loc: {op_info['loc']})",
-                    file=sys.stderr,
-                )
-                skipped_ops += 1
-
-        i += 1
+                    print(
+                        f"Warning: No memory stats found for operation '{op_info['mlir_op']}' at line {i+1} (loc: {op_info['loc']})",
+                        file=sys.stderr,
+                    )
+                    skipped_ops += 1
 
     # Parse inputs registry from MLIR module
     registry = None
-    weight_lookup = {}
     if registry_output:
         registry = parse_inputs_registry(log_path)
 
         # Build lookup by shape: shape -> registry entry (only for weights)
         # This allows matching based on tensor shape rather than SSA names
         # (SSA names like %arg0, %arg1 can mean different things in different MLIR modules)
+        # Shape strings are interned by the MLIR parser and cache their hash,
+        # so a single dict.get per input shape is the whole lookup cost
         weight_lookup_by_shape = {}
         for entry in registry.get("entries", []):
-            if entry["type"] in ("parameter", "constant"):
-                weight_lookup_by_shape[entry["shape"]] = entry
+            if entry.type in ("parameter", "constant"):
+                weight_lookup_by_shape[entry.shape] = entry
 
         # Track which weights are passed to each const_eval invocation
         # Key: (const_eval_name, op_index) -> list of weight info
-        const_eval_weights: Dict[str, List[Dict]] = {}
+        const_eval_weights: Dict[Tuple[str, int], List[Dict]] = {}
 
-        # First pass: identify load_cached operations and record which weights they pass
-        # Match weights by input_shapes rather than SSA names
-        for op_info in operations:
-            if "load_cached" in op_info.get("mlir_op", ""):
+        # Derived weights: SSA values that are outputs of weight operations.
+        # Key includes load_cached index to properly scope derived weights to each invocation
+        derived_weights: Dict[Tuple[str, Optional[int], str], List[Dict]] = {}
+        # registry_index values already in each op's weights, by op position
+        # (built on first use and kept across sweeps)
+        op_weight_indices: Dict[int, set] = {}
+        missed_keys: set = set()
+
+        # Single sweep in execution order:
+        # - load_cached operations record which weights they pass
+        # - const_eval operations inherit those weights from the load_cached
+        #   that invoked them and propagate them through const_eval chains
+        # - other operations match weights by input shape
+        current_load_cached_idx = None
+        for op_pos, (op_info, is_load_cached) in enumerate(zip(operations, op_is_load_cached)):
+            if is_load_cached:
                 weights = []
                 const_eval_name = None
                 for inp in op_info.get("inputs", []):
@@ -266,111 +543,88 @@ def parse_log_file(
 
                 # Match weights by input shape
                 for shape in op_info.get("input_shapes", []):
-                    if shape and shape in weight_lookup_by_shape:
-                        w = weight_lookup_by_shape[shape]
+                    w = weight_lookup_by_shape.get(shape) if shape else None
+                    if w is not None:
                         weights.append(
                             {
-                                "registry_index": w["index"],
-                                "name": w["name"],
-                                "shape": w["shape"],
-                                "dtype": w["dtype"],
-                                "bytes": w["bytes"],
+                                "registry_index": w.index,
+                                "name": w.name,
+                                "shape": w.shape,
+                                "dtype": w.dtype,
+                                "bytes": w.bytes,
                             }
                         )
                 op_info["weights"] = weights
+                if weights:
+                    op_info["is_weight_op"] = True
 
                 # Record weights for the const_eval function that will be invoked next
                 if const_eval_name and weights:
-                    const_eval_weights[f"{const_eval_name}_{op_info['index']}"] = (
-                        weights
-                    )
+                    const_eval_weights[(const_eval_name, op_info["index"])] = weights
 
-        # Second pass: for each const_eval operation, find the load_cached that invoked it
-        # and inherit those weights
-        current_load_cached_idx = None
-        for i, op_info in enumerate(operations):
-            # Track when we see a load_cached (the next const_eval operations belong to it)
-            if "load_cached" in op_info.get("mlir_op", ""):
+                # The next const_eval operations belong to this load_cached
                 current_load_cached_idx = op_info["index"]
                 continue
 
             # For const_eval operations, look up weights from the load_cached that invoked it
+            # (const_eval operations are already marked as weight operations)
             if op_info.get("const_eval_graph"):
                 const_eval_name = op_info["const_eval_graph"]
-                key = f"{const_eval_name}_{current_load_cached_idx}"
-                if key in const_eval_weights:
-                    op_info["weights"] = const_eval_weights[key].copy()
-                else:
-                    op_info["weights"] = []
+                inherited = const_eval_weights.get((const_eval_name, current_load_cached_idx))
+                op_info["weights"] = inherited.copy() if inherited is not None else []
+                _propagate_derived_weights(
+                    op_pos,
+                    op_info,
+                    current_load_cached_idx,
+                    derived_weights,
+                    op_weight_indices,
+                    missed_keys,
+                )
             elif "weights" not in op_info:
                 # Non-const_eval operations: match weights by input shapes
                 weights = []
+                seen_indices = set()
                 for shape in op_info.get("input_shapes", []):
-                    if shape and shape in weight_lookup_by_shape:
-                        w = weight_lookup_by_shape[shape]
+                    w = weight_lookup_by_shape.get(shape) if shape else None
+                    if w is not None:
                         # Avoid duplicates
-                        if not any(
-                            existing["registry_index"] == w["index"]
-                            for existing in weights
-                        ):
+                        if w.index not in seen_indices:
+                            seen_indices.add(w.index)
                             weights.append(
                                 {
-                                    "registry_index": w["index"],
-                                    "name": w["name"],
-                                    "shape": w["shape"],
-                                    "dtype": w["dtype"],
-                                    "bytes": w["bytes"],
+                                    "registry_index": w.index,
+                                    "name": w.name,
+                                    "shape": w.shape,
+                                    "dtype": w.dtype,
+                                    "bytes": w.bytes,
                                 }
                             )
                 op_info["weights"] = weights
+                if weights:
+                    op_info["is_weight_op"] = True
 
-        # Third pass: propagate weights through const_eval chains
-        # Track derived weights: SSA values that are outputs of weight operations
-        # Key includes load_cached index to properly scope derived weights to each invocation
-        derived_weights: Dict[str, List[Dict]] = {}
-
-        changed = True
-        while changed:
-            changed = False
+        # Operations run in execution order, so a producer normally precedes
+        # its consumers and the sweep above reaches the fixed point. Another
+        # propagation sweep is only needed when an input looked up before it
+        # was registered has been registered since.
+        while any(key in derived_weights for key in missed_keys):
+            missed_keys = set()
             current_load_cached_idx = None
-            for op_info in operations:
+            for op_pos, (op_info, is_load_cached) in enumerate(
+                zip(operations, op_is_load_cached)
+            ):
                 # Track load_cached index for scoping
-                if "load_cached" in op_info.get("mlir_op", ""):
+                if is_load_cached:
                     current_load_cached_idx = op_info["index"]
-                    continue
-
-                # Only process const_eval operations
-                if not op_info.get("const_eval_graph"):
-                    continue
-
-                # Use load_cached index to scope derived weights
-                scope_prefix = (
-                    f"{op_info['const_eval_graph']}_{current_load_cached_idx}"
-                )
-
-                # Check if any input is a derived weight (within same const_eval invocation)
-                for inp in op_info.get("inputs", []):
-                    key = f"{scope_prefix}_{inp}"
-                    if key in derived_weights:
-                        for dw in derived_weights[key]:
-                            if not any(
-                                w.get("registry_index") == dw.get("registry_index")
-                                for w in op_info["weights"]
-                            ):
-                                op_info["weights"].append(dw.copy())
-                                changed = True
-
-                # If this operation has weights, register its output as derived
-                if op_info["weights"] and op_info.get("result"):
-                    key = f"{scope_prefix}_{op_info['result']}"
-                    if key not in derived_weights:
-                        derived_weights[key] = op_info["weights"].copy()
-                        changed = True
-
-        # Mark operations with weights as weight operations
-        for op_info in operations:
-            if op_info.get("weights") and not op_info.get("is_weight_op"):
-                op_info["is_weight_op"] = True
+                elif op_info.get("const_eval_graph"):
+                    _propagate_derived_weights(
+                        op_pos,
+                        op_info,
+                        current_load_cached_idx,
+                        derived_weights,
+                        op_weight_indices,
+                        missed_keys,
+                    )
 
     # Extract memory configuration from first operation
     memory_config = {}
@@ -386,6 +640,7 @@ def parse_log_file(
                 }
 
     # Write outputs - memory JSON with metadata header
+    outputs_written = True
     try:
         mem_output_data = {
             "metadata": {
@@ -394,24 +649,29 @@ def parse_log_file(
             },
             "operations": memory_stats,
         }
-        with open(mem_output, "w", encoding="utf-8") as f:
-            json.dump(mem_output_data, f, indent=2)
+        _write_json(mem_output, mem_output_data)
         print(f"Memory statistics written to: {mem_output}")
     except Exception as e:
         print(f"Error writing memory output: {e}", file=sys.stderr)
+        outputs_written = False
 
     try:
-        with open(ops_output, "w", encoding="utf-8") as f:
-            json.dump(operations, f, indent=2)
+        _write_json(ops_output, operations)
         print(f"Operation details written to: {ops_output}")
     except Exception as e:
         print(f"Error writing operations output: {e}", file=sys.stderr)
+        outputs_written = False
 
     # Write registry output if requested
     if registry_output and registry:
         try:
-            with open(registry_output, "w", encoding="utf-8") as f:
-                json.dump(registry, f, indent=2)
+            _write_json(
+                registry_output,
+                {
+                    "metadata": registry["metadata"],
+                    "entries": [e._asdict() for e in registry["entries"]],
+                },
+            )
             print(f"Inputs registry written to: {registry_output}")
         except Exception as e:
             print(f"Error writing registry output: {e}", file=sys.stderr)
@@ -420,8 +680,7 @@ def parse_log_file(
     if ir_output:
         try:
             ir_data = parse_ir_modules(log_path)
-            with open(ir_output, "w", encoding="utf-8") as f:
-                json.dump(ir_data, f, indent=2)
+            _write_json(ir_output, ir_data)
             print(f"IR modules written to: {ir_output}")
         except Exception as e:
             print(f"Error writing IR output: {e}", file=sys.stderr)
@@ -435,7 +694,7 @@ def parse_log_file(
     print(f"  Deallocate operations excluded: {deallocate_count}")
     print(f"  Get_device operations excluded: {get_device_count}")
     print(f"  Operations skipped (no memory stats): {skipped_ops}")
-    print(f"  Total log lines processed: {len(lines)}")
+    print(f"  Total log lines processed: {line_count}")
 
     if const_eval_ops_count:
         print(f"\nConst Eval Summary:")
@@ -466,6 +725,10 @@ def parse_log_file(
         print(f"  Weight operations (const_eval + direct): {weight_ops}")
         print(f"  Activation operations: {activation_ops}")
 
+    if not outputs_written:
+        return None
+    return memory_stats, operations
+
 
 def validate_outputs(mem_file: str, ops_file: str) -> bool:
     """
@@ -479,10 +742,8 @@ def validate_outputs(mem_file: str, ops_file: str) -> bool:
         True if validation passes, False otherwise
     """
     try:
-        with open(mem_file, "r") as f:
-            mem_json = json.load(f)
-        with open(ops_file, "r") as f:
-            ops_data = json.load(f)
+        mem_json = load_json(mem_file)
+        ops_data = load_json(ops_file)
 
         # Handle both old format (list) and new format (dict with metadata)
         if isinstance(mem_json, dict) and "operations" in mem_json:
@@ -535,11 +796,12 @@ def validate_log_content(log_path: str) -> Optional[str]:
     has_memory_states = False
 
     try:
-        with open(log_path, "r", encoding="utf-8", errors="replace") as f:
+        # Only substring tests are needed, so scan raw bytes and skip decoding
+        with open(log_path, "rb") as f:
             for line in f:
-                if not has_operations and "Executing operation:" in line and "RuntimeTTNN" in line:
+                if not has_operations and b"Executing operation:" in line and b"RuntimeTTNN" in line:
                     has_operations = True
-                if not has_memory_states and "Device memory state before operation" in line:
+                if not has_memory_states and b"Device memory state before operation" in line:
                     has_memory_states = True
                 if has_operations and has_memory_states:
                     return None
@@ -30,11 +30,26 @@ Usage:
 """
 
 import argparse
+import atexit
+import io
+import multiprocessing
 import os
+import queue
 import subprocess
 import sys
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
 from datetime import datetime
 from pathlib import Path
+from typing import Optional, Tuple
+
+
+# Output of the profiled script is copied in chunks of up to 64 KiB and
+# written to the log through a 1 MiB buffer
+_PIPE_CHUNK_SIZE = 1 << 16
+_LOG_BUFFER_SIZE = 1 << 20
+# Seconds between liveness checks while waiting for a background parse
+_RESULT_POLL_INTERVAL = 1.0
 
 
 def sanitize_report_name(log_name: str) -> str:
@@ -68,26 +83,153 @@ def run_and_capture(target_script: Path, output_dir: Path, script_name: str) ->
     env = os.environ.copy()
     env["TTMLIR_RUNTIME_LOGGER_LEVEL"] = "DEBUG"
 
-    # Run target script with tee to capture logs
+    # Run target script and copy its output to both the console and the log
     print(f"\nRunning {target_script.name}...")
     print("(This may take several minutes...)\n")
+    sys.stdout.flush()
 
     # Use -u flag to disable Python output buffering for proper log capture
-    cmd = f"python -u {target_script} 2>&1 | tee {log_file}"
-    result = subprocess.run(cmd, shell=True, env=env)
+    cmd = [sys.executable, "-u", str(target_script)]
+    console = sys.stdout.buffer
+    with open(log_file, "wb", buffering=_LOG_BUFFER_SIZE) as log, subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, env=env
+    ) as proc:
+        # read1 returns whatever output is available, so the console stays live
+        while True:
+            chunk = proc.stdout.read1(_PIPE_CHUNK_SIZE)
+            if not chunk:
+                break
+            console.write(chunk)
+            console.flush()
+            log.write(chunk)
+
+    if proc.returncode != 0:
+        print(f"\nWarning: Script exited with code {proc.returncode}")
+
+    return log_file, proc.returncode
+
+
+def get_output_paths(output_dir: Path, script_name: str) -> Tuple[Path, Path, Path, Path]:
+    """Get the memory, operations, inputs registry and IR JSON output paths"""
+    return (
+        output_dir / f"{script_name}_memory.json",
+        output_dir / f"{script_name}_operations.json",
+        output_dir / f"{script_name}_inputs_registry.json",
+        output_dir / f"{script_name}_ir.json",
+    )
 
-    if result.returncode != 0:
-        print(f"\nWarning: Script exited with code {result.returncode}")
 
-    return log_file, result.returncode
+def _parse_followed_log(log_file: str, outputs: Tuple[str, ...], finished, results) -> None:
+    """Parse and validate a log while it is written (child process target)
+
+    Console output is buffered and sent back through results, so it does
+    not interleave with the profiled script's output. The parse and the
+    output of validating the written JSON files are sent separately; the
+    latter is None if the parse did not write them.
+    """
+    stdout, stderr = io.StringIO(), io.StringIO()
+    validation = None
+    try:
+        from memory_profiler.parser import follow_log_lines, parse_log_file, validate_outputs
+
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            parsed = parse_log_file(log_file, *outputs, lines=follow_log_lines(log_file, finished))
+        if parsed is not None:
+            validation_stdout, validation_stderr = io.StringIO(), io.StringIO()
+            with redirect_stdout(validation_stdout), redirect_stderr(validation_stderr):
+                validate_outputs(outputs[0], outputs[1])
+            validation = (validation_stdout.getvalue(), validation_stderr.getvalue())
+    except Exception:
+        traceback.print_exc(file=stderr)
+    finally:
+        results.put((stdout.getvalue(), stderr.getvalue(), validation))
+
+
+class BackgroundParse:
+    """Parse a log in a child process while the profiled script is still writing it
+
+    Parsing overlaps with the script's run, so the JSON outputs are nearly
+    ready by the time it exits. The child is not a daemon, since the IR
+    parser may start its own worker processes; it is joined by finish(),
+    or terminated by cancel() and at interpreter exit.
+    """
 
+    def __init__(self, log_file: Path, output_dir: Path, script_name: str):
+        self.finished = multiprocessing.Event()
+        # Console output of the child's output validation, once finish() returns
+        self.validation_output: Optional[Tuple[str, str]] = None
+        self._results = multiprocessing.Queue()
+        outputs = tuple(str(p) for p in get_output_paths(output_dir, script_name))
+        self._process = multiprocessing.Process(
+            target=_parse_followed_log,
+            args=(str(log_file), outputs, self.finished, self._results),
+        )
+        self._process.start()
+        atexit.register(self.cancel)
+
+    def finish(self) -> bool:
+        """Signal that the log is complete, wait for the parse and print its output
+
+        Returns:
+            True if the parse ran to completion, False if the child process
+            died without reporting back
+        """
+        self.finished.set()
+        while True:
+            try:
+                stdout, stderr, self.validation_output = self._results.get(
+                    timeout=_RESULT_POLL_INTERVAL
+                )
+                break
+            except queue.Empty:
+                if self._process.is_alive():
+                    continue
+            # The child may have exited right after reporting back
+            try:
+                stdout, stderr, self.validation_output = self._results.get(
+                    timeout=_RESULT_POLL_INTERVAL
+                )
+                break
+            except queue.Empty:
+                self._process.join()
+                atexit.unregister(self.cancel)
+                print(
+                    f"Warning: Background parse exited with code {self._process.exitcode}",
+                    file=sys.stderr,
+                )
+                return False
+        self._process.join()
+        atexit.unregister(self.cancel)
+        sys.stdout.write(stdout)
+        sys.stdout.flush()
+        sys.stderr.write(stderr)
+        return True
+
+    def cancel(self) -> None:
+        """Stop the parse without waiting for its outputs"""
+        atexit.unregister(self.cancel)
+        self.finished.set()
+        self._process.terminate()
+        self._process.join()
+
+
+def analyze_log(
+    log_file: Path,
+    output_dir: Path,
+    script_name: str,
+    background_parse: Optional[BackgroundParse] = None,
+):
+    """Parse log file and generate JSON outputs
 
-def analyze_log(log_file: Path, output_dir: Path, script_name: str):
-    """Parse log file and generate JSON outputs"""
-    mem_json = output_dir / f"{script_name}_memory.json"
-    ops_json = output_dir / f"{script_name}_operations.json"
-    registry_json = output_dir / f"{script_name}_inputs_registry.json"
-    ir_json = output_dir / f"{script_name}_ir.json"
+    Args:
+        log_file: Path to the log file
+        output_dir: Directory for the JSON outputs
+        script_name: Prefix of the JSON output file names
+        background_parse: Parse already running on the log while it was
+            captured; it is completed instead of parsing the log again,
+            unless its process died
+    """
+    mem_json, ops_json, registry_json, ir_json = get_output_paths(output_dir, script_name)
 
     try:
         from memory_profiler.parser import parse_log_file, validate_outputs
@@ -96,13 +238,25 @@ def analyze_log(log_file: Path, output_dir: Path, script_name: str):
         print("\n" + "=" * 70)
         print("Parsing logs...")
         print("=" * 70)
-        parse_log_file(str(log_file), str(mem_json), str(ops_json), str(registry_json), str(ir_json))
+        validation_output = None
+        if background_parse is not None and background_parse.finish():
+            # The child process already validated the files it wrote
+            validation_output = background_parse.validation_output
+        else:
+            parse_log_file(
+                str(log_file), str(mem_json), str(ops_json), str(registry_json), str(ir_json)
+            )
 
         # Validate outputs
         print("\n" + "=" * 70)
         print("Validating outputs...")
         print("=" * 70)
-        validate_outputs(str(mem_json), str(ops_json))
+        if validation_output is not None:
+            sys.stdout.write(validation_output[0])
+            sys.stdout.flush()
+            sys.stderr.write(validation_output[1])
+        else:
+            validate_outputs(str(mem_json), str(ops_json))
 
         print("\n" + "=" * 70)
         print("Analysis complete!")
@@ -269,6 +423,13 @@ Examples:
         output_dir = base_dir / f"{script_name}_{timestamp}"
         output_dir.mkdir(parents=True, exist_ok=True)
 
+        # Unless only capturing, parse the log in the background as it is written
+        background_parse = None
+        if not args.log:
+            background_parse = BackgroundParse(
+                output_dir / f"{script_name}_profile.log", output_dir, script_name
+            )
+
         # Run and capture logs
         log_file, return_code = run_and_capture(target_script, output_dir, script_name)
 
@@ -290,11 +451,12 @@ Examples:
         from memory_profiler.parser import validate_log_content
         content_error = validate_log_content(str(log_file))
         if content_error:
+            background_parse.cancel()
             print(content_error)
             sys.exit(1)
 
         # Default: parse and visualize
-        analyze_log(log_file, output_dir, script_name)
+        analyze_log(log_file, output_dir, script_name, background_parse)
         generate_visualization(output_dir)
 
     else:
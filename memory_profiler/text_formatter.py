@@ -9,9 +9,29 @@ Generates compact, markdown-formatted reports designed for LLM consumption,
 following the llms.txt standard (https://llmstxt.org/).
 """
 
-import json
+import functools
+import heapq
+from array import array
+from collections import Counter
+from itertools import zip_longest
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
+
+# Handle both package import and direct execution
+try:
+    from ._json_compat import load_json
+except ImportError:
+    from _json_compat import load_json
+
+
+@functools.lru_cache(maxsize=None)
+def _short_op(mlir_op: str) -> str:
+    """Strip the dialect prefix from an op name, e.g. 'ttnn.matmul' -> 'matmul'.
+
+    Profiles have few distinct op names, so the cache returns one shared
+    string per name instead of splitting every operation's name again.
+    """
+    return mlir_op.rsplit(".", 1)[-1]
 
 
 class LLMTextFormatter:
@@ -53,17 +73,14 @@ class LLMTextFormatter:
                 f"Hint: Run 'tt-memory-profiler --analyze <log_file>' first to generate JSON files."
             )
 
-        # Load data
-        with open(self.mem_file) as f:
-            mem_json = json.load(f)
-        with open(self.ops_file) as f:
-            self.ops_data = json.load(f)
+        # Load data (the decoders take UTF-8 bytes directly)
+        mem_json = load_json(self.mem_file)
+        self.ops_data = load_json(self.ops_file)
 
         # Load registry if it exists
         self.registry = None
         if self.registry_file.exists():
-            with open(self.registry_file) as f:
-                self.registry = json.load(f)
+            self.registry = load_json(self.registry_file)
 
         # Handle both old format (list) and new format (dict with metadata)
         if isinstance(mem_json, dict) and "metadata" in mem_json:
@@ -80,6 +97,10 @@ class LLMTextFormatter:
                 if all(mt in op.get("memory", {}) for op in self.mem_data):
                     self.available_memory_types.append(mt)
 
+        # Results of _scan(), keyed by the number of top operations kept
+        self._scan_cache: Dict[int, Dict] = {}
+        self._allocated: Optional[Dict[str, array]] = None
+
     def generate_report(self, output_file: Path = None) -> str:
         """
         Generate LLM-friendly text report.
@@ -90,29 +111,62 @@ class LLMTextFormatter:
         Returns:
             The generated report as a string
         """
-        if not self.mem_data:
-            report = f"# Memory Profile: {self.script_name}\n\n> No operations recorded.\n"
-            if output_file:
-                output_file.write_text(report)
-            return report
-
-        sections = [
-            self._format_header(),
-            self._format_configuration(),
-            self._format_peak_memory_table(),
-            self._format_top_consumers_table(n=10),
-            self._format_padding_overhead_table(n=10),
-            self._format_weights_registry(),
-            self._format_operation_distribution(),
-        ]
-
-        report = "\n".join(s for s in sections if s)
+        lines: List[str] = []
+        self._write_sections(lines.append)
+        report = "\n".join(lines)
 
         if output_file:
-            output_file.write_text(report)
+            output_file.write_text(report, encoding="utf-8")
 
         return report
 
+    def write_report(self, output_file: Path) -> None:
+        """
+        Write the LLM-friendly text report straight to a file.
+
+        The report is streamed line by line, so it is never held in memory
+        as a whole. The file content matches generate_report().
+
+        Args:
+            output_file: Output file path
+        """
+        with open(output_file, "w", encoding="utf-8") as f:
+            # Lines are joined with newlines, as in generate_report()
+            separator = ""
+
+            def write_line(line: str) -> None:
+                nonlocal separator
+                f.write(separator)
+                f.write(line)
+                separator = "\n"
+
+            self._write_sections(write_line)
+
+    def _write_sections(self, write: Callable[[str], None]) -> None:
+        """
+        Pass the report to write one line at a time, without line terminators.
+
+        Each section ends with a blank line; sections with nothing to show
+        write nothing.
+
+        Args:
+            write: Callback receiving one report line at a time
+        """
+        if not self.mem_data:
+            write(f"# Memory Profile: {self.script_name}")
+            write("")
+            write("> No operations recorded.")
+            write("")
+            return
+
+        self._format_header(write)
+        self._format_configuration(write)
+        self._format_peak_memory_table(write)
+        self._format_top_consumers_table(write, n=10)
+        self._format_padding_overhead_table(write, n=10)
+        self._format_weights_registry(write)
+        self._format_operation_distribution(write)
+
     def _truncate_loc(self, loc: str, max_len: int = 50) -> str:
         """Truncate location string if too long"""
         if not loc:
@@ -121,7 +175,7 @@ class LLMTextFormatter:
             return loc
         return loc[:max_len - 3] + "..."
 
-    def _format_header(self) -> str:
+    def _format_header(self, write: Callable[[str], None]) -> None:
         """Format H1 title and blockquote summary"""
         summary_stats = self._compute_summary_stats()
         peak_analysis = self._analyze_peaks()
@@ -158,11 +212,14 @@ class LLMTextFormatter:
 
         summary = " | ".join(parts)
 
-        return f"# Memory Profile: {self.script_name}\n\n> {summary}\n"
+        write(f"# Memory Profile: {self.script_name}")
+        write("")
+        write(f"> {summary}")
+        write("")
 
-    def _format_configuration(self) -> str:
+    def _format_configuration(self, write: Callable[[str], None]) -> None:
         """Format configuration section"""
-        lines = ["## Configuration"]
+        write("## Configuration")
 
         # Memory configuration
         if self.mem_metadata and "memory_config" in self.mem_metadata:
@@ -174,29 +231,25 @@ class LLMTextFormatter:
                     capacity = config[mem_type].get("total_bytes_per_bank_MB", 0)
                     mem_parts.append(f"{mem_type} {num_banks} x {capacity:.2f} MB/bank")
             if mem_parts:
-                lines.append(f"- Memory: {' | '.join(mem_parts)}")
+                write(f"- Memory: {' | '.join(mem_parts)}")
 
         # Operation counts
         total_ops = len(self.mem_data)
-        weight_ops = sum(
-            1 for i, op in enumerate(self.mem_data)
-            if op.get("is_weight_op", False) or
-               (i < len(self.ops_data) and self.ops_data[i].get("is_weight_op", False))
-        )
+        weight_ops = self._scan()["weight_ops"]
         activation_ops = total_ops - weight_ops
-        lines.append(f"- Operations: {total_ops:,} total ({weight_ops:,} weight, {activation_ops:,} activation)")
+        write(f"- Operations: {total_ops:,} total ({weight_ops:,} weight, {activation_ops:,} activation)")
 
-        return "\n".join(lines) + "\n"
+        write("")
 
-    def _format_peak_memory_table(self) -> str:
+    def _format_peak_memory_table(self, write: Callable[[str], None]) -> None:
         """Format peak memory analysis as markdown table"""
         peak_analysis = self._analyze_peaks()
         if not peak_analysis:
-            return ""
+            return
 
-        lines = ["## Peak Memory"]
-        lines.append("| Type | Op# | Operation | Location | Allocated | Capacity | Utilization |")
-        lines.append("|------|-----|-----------|----------|-----------|----------|-------------|")
+        write("## Peak Memory")
+        write("| Type | Op# | Operation | Location | Allocated | Capacity | Utilization |")
+        write("|------|-----|-----------|----------|-----------|----------|-------------|")
 
         for mem_type in ["DRAM", "L1", "L1_SMALL", "TRACE"]:
             if mem_type not in peak_analysis:
@@ -213,22 +266,22 @@ class LLMTextFormatter:
             loc = self._truncate_loc(op.get("loc", ""))
             mlir_op = op.get("mlir_op", "unknown")
 
-            lines.append(
+            write(
                 f"| {mem_type} | {idx} | {mlir_op} | {loc} | "
                 f"{allocated:.2f} MB | {capacity:.2f} MB | {utilization:.1f}% |"
             )
 
-        return "\n".join(lines) + "\n"
+        write("")
 
-    def _format_top_consumers_table(self, n: int = 10) -> str:
+    def _format_top_consumers_table(self, write: Callable[[str], None], n: int = 10) -> None:
         """Format top memory consumers as markdown table"""
         top_ops = self._get_top_operations(n=n)
         if not top_ops:
-            return ""
+            return
 
-        lines = [f"## Top {n} Memory Consumers (DRAM)"]
-        lines.append("| Rank | Op# | Operation | Location | DRAM (MB) | Input | Output |")
-        lines.append("|------|-----|-----------|----------|-----------|-------|--------|")
+        write(f"## Top {n} Memory Consumers (DRAM)")
+        write("| Rank | Op# | Operation | Location | DRAM (MB) | Input | Output |")
+        write("|------|-----|-----------|----------|-----------|-------|--------|")
 
         for rank, item in enumerate(top_ops, 1):
             op = item["operation"]
@@ -244,21 +297,21 @@ class LLMTextFormatter:
             input_str = ", ".join(s for s in input_shapes if s) if input_shapes else "N/A"
             output_str = ", ".join(s for s in output_shapes if s) if output_shapes else "N/A"
 
-            lines.append(
+            write(
                 f"| {rank} | {idx} | {mlir_op} | {loc} | {dram:.2f} | {input_str} | {output_str} |"
             )
 
-        return "\n".join(lines) + "\n"
+        write("")
 
-    def _format_padding_overhead_table(self, n: int = 10) -> str:
+    def _format_padding_overhead_table(self, write: Callable[[str], None], n: int = 10) -> None:
         """Format top padding overhead operations as markdown table"""
         top_padding_ops = self._get_top_padding_overhead_ops(n=n)
         if not top_padding_ops:
-            return ""
+            return
 
-        lines = [f"## Top {n} Padding Overhead"]
-        lines.append("| Rank | Op# | Operation | Logical | Padded | Overhead |")
-        lines.append("|------|-----|-----------|---------|--------|----------|")
+        write(f"## Top {n} Padding Overhead")
+        write("| Rank | Op# | Operation | Logical | Padded | Overhead |")
+        write("|------|-----|-----------|---------|--------|----------|")
 
         for rank, item in enumerate(top_padding_ops, 1):
             op = item["operation"]
@@ -276,17 +329,17 @@ class LLMTextFormatter:
             absolute_overhead = padded_bytes - unpadded_bytes
             overhead_mb = absolute_overhead / (1024 * 1024)
 
-            lines.append(
+            write(
                 f"| {rank} | {idx} | {mlir_op} | {logical_shape} ({dtype}) | "
                 f"{padded_shape} | {overhead_mb:.2f} MB ({overhead_pct:.1f}%) |"
             )
 
-        return "\n".join(lines) + "\n"
+        write("")
 
-    def _format_weights_registry(self) -> str:
+    def _format_weights_registry(self, write: Callable[[str], None]) -> None:
         """Format model weights registry as markdown table"""
         if not self.registry or not self.registry.get("entries"):
-            return ""
+            return
 
         # Filter to parameters and constants only
         weight_entries = [
@@ -294,17 +347,18 @@ class LLMTextFormatter:
             if e.get("type") in ("parameter", "constant")
         ]
         if not weight_entries:
-            return ""
+            return
 
-        # Sort by size descending
-        weight_entries.sort(key=lambda e: e.get("bytes", 0), reverse=True)
+        # Largest 20 by size, descending; ties keep registry order as a
+        # stable sort would, without sorting every entry
+        top_weights = heapq.nlargest(20, weight_entries, key=lambda e: e.get("bytes", 0))
 
         total_mb = self.registry.get("metadata", {}).get("total_weight_MB", 0)
-        lines = [f"## Model Weights ({total_mb:.1f} MB total)"]
-        lines.append("| Name | Shape | Type | Size |")
-        lines.append("|------|-------|------|------|")
+        write(f"## Model Weights ({total_mb:.1f} MB total)")
+        write("| Name | Shape | Type | Size |")
+        write("|------|-------|------|------|")
 
-        for entry in weight_entries[:20]:  # Limit to top 20 weights
+        for entry in top_weights:  # Limit to top 20 weights
             name = entry.get("name", "unknown")
             shape = "x".join(str(d) for d in entry.get("shape", []))
             dtype = entry.get("dtype", "?")
@@ -317,147 +371,189 @@ class LLMTextFormatter:
             else:
                 size_str = f"{size_bytes} B"
 
-            lines.append(f"| {name} | {shape} | {dtype} | {size_str} |")
+            write(f"| {name} | {shape} | {dtype} | {size_str} |")
 
         if len(weight_entries) > 20:
-            lines.append(f"\n*... and {len(weight_entries) - 20} more weights*")
+            write(f"\n*... and {len(weight_entries) - 20} more weights*")
 
-        return "\n".join(lines) + "\n"
+        write("")
 
-    def _format_operation_distribution(self) -> str:
+    def _format_operation_distribution(self, write: Callable[[str], None]) -> None:
         """Format operation type distribution as bullet list"""
         op_distribution = self._get_op_distribution()
         if not op_distribution:
-            return ""
+            return
 
         total_ops = sum(op_distribution.values())
-        # Sort by count descending
-        sorted_ops = sorted(op_distribution.items(), key=lambda x: x[1], reverse=True)
+        # Top 15 op types by count; ties keep first-seen order
+        top_ops = op_distribution.most_common(15)
 
-        lines = ["## Operation Distribution"]
-        for op_name, count in sorted_ops[:15]:  # Top 15 op types
+        write("## Operation Distribution")
+        for op_name, count in top_ops:
             pct = (count / total_ops * 100) if total_ops > 0 else 0
-            lines.append(f"- {op_name}: {count:,} ({pct:.1f}%)")
+            write(f"- {op_name}: {count:,} ({pct:.1f}%)")
 
-        if len(sorted_ops) > 15:
-            remaining = sum(c for _, c in sorted_ops[15:])
-            lines.append(f"- *other*: {remaining:,}")
+        if len(op_distribution) > 15:
+            remaining = total_ops - sum(c for _, c in top_ops)
+            write(f"- *other*: {remaining:,}")
 
-        return "\n".join(lines) + "\n"
+        write("")
 
     # === Analysis methods (adapted from visualizer.py) ===
 
-    def _compute_summary_stats(self) -> Dict:
-        """Compute summary statistics"""
-        stats = {"total_ops": len(self.mem_data), "memory_types": {}}
+    def _scan(self, top_n: int = 10) -> Dict:
+        """Walk the memory and operation data once, collecting all report statistics
 
-        for mem_type in self.available_memory_types:
-            allocated_values = [
-                op["memory"][mem_type]["totalBytesAllocatedPerBank_MB"]
-                for op in self.mem_data
-            ]
-
-            stats["memory_types"][mem_type] = {
-                "peak": max(allocated_values),
-                "min": min(allocated_values),
-                "avg": sum(allocated_values) / len(allocated_values),
-                "capacity": self.mem_data[0]["memory"][mem_type]["totalBytesPerBank_MB"],
+        Each analysis method below reads its part of the result, so the
+        report touches every operation once instead of once per table. The
+        top-N tables are kept in bounded heaps rather than sorting every op.
+        Results are cached per top_n.
+        """
+        if top_n in self._scan_cache:
+            return self._scan_cache[top_n]
+
+        weight_ops = 0
+        op_counts = Counter()
+        # Min-heap of (value, -index): ties keep the earlier operation, as
+        # a stable descending sort would
+        top_padding = []
+
+        for i, (mem, op) in enumerate(zip_longest(self.mem_data, self.ops_data)):
+            if mem is not None:
+                if mem.get("is_weight_op", False) or (
+                    op is not None and op.get("is_weight_op", False)
+                ):
+                    weight_ops += 1
+
+            if op is not None:
+                op_counts[_short_op(op.get("mlir_op", "unknown"))] += 1
+
+                layout_info = op.get("output_layout_info")
+                if layout_info and layout_info.get("overhead_pct", 0) > 0:
+                    padded_bytes = layout_info.get("padded_bytes", 0)
+                    unpadded_bytes = layout_info.get("unpadded_bytes", 0)
+                    item = (padded_bytes - unpadded_bytes, -i)
+                    if len(top_padding) < top_n:
+                        heapq.heappush(top_padding, item)
+                    elif top_n > 0:
+                        heapq.heappushpop(top_padding, item)
+
+        # Per-type statistics run as C-level loops over the allocation columns
+        num_ops = len(self.mem_data)
+        summary = {"total_ops": num_ops, "memory_types": {}}
+        peak_analysis = {}
+        columns = self._allocated_columns()
+        for mt, allocated in columns.items():
+            peak = max(allocated)
+            # First operation at the peak, as max() over the indices picked
+            peak_idx = allocated.index(peak)
+            summary["memory_types"][mt] = {
+                "peak": peak,
+                "min": min(allocated),
+                "avg": sum(allocated) / num_ops,
+                "capacity": self.mem_data[0]["memory"][mt]["totalBytesPerBank_MB"],
             }
-
-        return stats
-
-    def _analyze_peaks(self) -> Dict:
-        """Analyze peak memory usage for each type"""
-        peaks = {}
-
-        for mem_type in self.available_memory_types:
-            peak_idx = max(
-                range(len(self.mem_data)),
-                key=lambda i: self.mem_data[i]["memory"][mem_type][
-                    "totalBytesAllocatedPerBank_MB"
-                ],
-            )
-
-            peaks[mem_type] = {
+            peak_analysis[mt] = {
                 "index": peak_idx,
-                "memory": self.mem_data[peak_idx]["memory"][mem_type],
+                "memory": self.mem_data[peak_idx]["memory"][mt],
                 "operation": self.ops_data[peak_idx] if peak_idx < len(self.ops_data) else {},
             }
 
-        return peaks
+        # Top DRAM consumers are picked from the DRAM column by index; only
+        # the selected rows touch the operation dicts. nlargest keeps the
+        # earlier operation on ties, as a stable descending sort would.
+        top_operations = []
+        if "DRAM" in columns:
+            dram_column = columns["DRAM"]
+            for i in heapq.nlargest(top_n, range(num_ops), key=dram_column.__getitem__):
+                top_operations.append({
+                    "index": i,
+                    "dram": dram_column[i],
+                    "operation": self.ops_data[i] if i < len(self.ops_data) else {},
+                    "memory": self.mem_data[i],
+                })
+
+        top_padding_ops = []
+        for absolute_overhead, neg_idx in sorted(top_padding, reverse=True):
+            op = self.ops_data[-neg_idx]
+            layout_info = op["output_layout_info"]
+            top_padding_ops.append({
+                "index": -neg_idx,
+                "operation": op,
+                "layout_info": layout_info,
+                "overhead_pct": layout_info.get("overhead_pct", 0),
+                "absolute_overhead_bytes": absolute_overhead,
+            })
 
-    def _get_top_operations(self, n: int = 10) -> List[Dict]:
-        """Get top N memory-consuming operations (by DRAM)"""
-        if "DRAM" not in self.available_memory_types:
-            return []
-
-        ops_with_mem = [
-            {
-                "index": i,
-                "dram": self.mem_data[i]["memory"]["DRAM"]["totalBytesAllocatedPerBank_MB"],
-                "operation": self.ops_data[i] if i < len(self.ops_data) else {},
-                "memory": self.mem_data[i],
+        # Peak padding overhead is a C-level max() over the overhead columns;
+        # ops without unpadded data count as 0
+        if self.mem_data and self.mem_data[0].get("unpadded_memory"):
+            peak_padding = {
+                "dram_pct": max(0, max(self._unpadded_overhead_column("DRAM"))),
+                "l1_pct": max(0, max(self._unpadded_overhead_column("L1"))),
+                "has_data": True,
             }
-            for i in range(len(self.mem_data))
-        ]
-
-        ops_with_mem.sort(key=lambda x: x["dram"], reverse=True)
-        return ops_with_mem[:n]
+        else:
+            peak_padding = {"dram_pct": 0, "l1_pct": 0, "has_data": False}
+
+        result = {
+            "summary": summary,
+            "peaks": peak_analysis,
+            "top_operations": top_operations,
+            "top_padding_ops": top_padding_ops,
+            "op_counts": op_counts,
+            "weight_ops": weight_ops,
+            "peak_padding": peak_padding,
+        }
+        self._scan_cache[top_n] = result
+        return result
 
-    def _get_top_padding_overhead_ops(self, n: int = 10) -> List[Dict]:
-        """Get top N operations with highest absolute tile padding overhead"""
-        ops_with_overhead = []
+    def _allocated_columns(self) -> Dict[str, array]:
+        """Per-bank allocated MB of every operation, one column per memory type
 
-        for i, op in enumerate(self.ops_data):
-            layout_info = op.get("output_layout_info")
-            if not layout_info:
-                continue
+        Each nested memory dict is read once here; the statistics are then
+        computed over contiguous float arrays. Built on first use.
+        """
+        if self._allocated is None:
+            self._allocated = {
+                mt: array(
+                    "d",
+                    [op["memory"][mt]["totalBytesAllocatedPerBank_MB"] for op in self.mem_data],
+                )
+                for mt in self.available_memory_types
+            }
+        return self._allocated
+
+    def _unpadded_overhead_column(self, mem_type: str) -> array:
+        """Tile padding overhead (%) of the live tensors at every operation"""
+        return array(
+            "d",
+            [
+                (op.get("unpadded_memory") or {}).get(mem_type, {}).get("overhead_pct", 0)
+                for op in self.mem_data
+            ],
+        )
 
-            overhead_pct = layout_info.get("overhead_pct", 0)
-            if overhead_pct <= 0:
-                continue
+    def _compute_summary_stats(self) -> Dict:
+        """Compute summary statistics"""
+        return self._scan()["summary"]
 
-            padded_bytes = layout_info.get("padded_bytes", 0)
-            unpadded_bytes = layout_info.get("unpadded_bytes", 0)
-            absolute_overhead = padded_bytes - unpadded_bytes
+    def _analyze_peaks(self) -> Dict:
+        """Analyze peak memory usage for each type"""
+        return self._scan()["peaks"]
 
-            ops_with_overhead.append({
-                "index": i,
-                "operation": op,
-                "layout_info": layout_info,
-                "overhead_pct": overhead_pct,
-                "absolute_overhead_bytes": absolute_overhead,
-            })
+    def _get_top_operations(self, n: int = 10) -> List[Dict]:
+        """Get top N memory-consuming operations (by DRAM)"""
+        return self._scan(top_n=n)["top_operations"]
 
-        ops_with_overhead.sort(key=lambda x: x["absolute_overhead_bytes"], reverse=True)
-        return ops_with_overhead[:n]
+    def _get_top_padding_overhead_ops(self, n: int = 10) -> List[Dict]:
+        """Get top N operations with highest absolute tile padding overhead"""
+        return self._scan(top_n=n)["top_padding_ops"]
 
-    def _get_op_distribution(self) -> Dict:
+    def _get_op_distribution(self) -> Counter:
         """Get operation type distribution"""
-        op_counts = {}
-        for op in self.ops_data:
-            op_name = op.get("mlir_op", "unknown").split(".")[-1]
-            op_counts[op_name] = op_counts.get(op_name, 0) + 1
-        return op_counts
+        return self._scan()["op_counts"]
 
     def _calculate_peak_padding_overhead(self) -> Dict:
         """Calculate peak tile padding overhead from memory data"""
-        if not self.mem_data or not self.mem_data[0].get("unpadded_memory"):
-            return {"dram_pct": 0, "l1_pct": 0, "has_data": False}
-
-        peak_dram_pct = 0
-        peak_l1_pct = 0
-
-        for op in self.mem_data:
-            unpadded = op.get("unpadded_memory", {})
-            if unpadded:
-                dram = unpadded.get("DRAM", {})
-                l1 = unpadded.get("L1", {})
-                peak_dram_pct = max(peak_dram_pct, dram.get("overhead_pct", 0))
-                peak_l1_pct = max(peak_l1_pct, l1.get("overhead_pct", 0))
-
-        return {
-            "dram_pct": peak_dram_pct,
-            "l1_pct": peak_l1_pct,
-            "has_data": True,
-        }
+        return self._scan()["peak_padding"]
@@ -49,21 +49,21 @@ class MemoryVisualizer:
         self.ir_file = self.run_dir / f"{self.script_name}_ir.json"
 
         # Load data
-        with open(self.mem_file) as f:
+        with open(self.mem_file, encoding="utf-8") as f:
             mem_json = json.load(f)
-        with open(self.ops_file) as f:
+        with open(self.ops_file, encoding="utf-8") as f:
             self.ops_data = json.load(f)
 
         # Load registry if it exists
         self.registry = None
         if self.registry_file.exists():
-            with open(self.registry_file) as f:
+            with open(self.registry_file, encoding="utf-8") as f:
                 self.registry = json.load(f)
 
         # Load IR data if it exists
         self.ir_data = None
         if self.ir_file.exists():
-            with open(self.ir_file) as f:
+            with open(self.ir_file, encoding="utf-8") as f:
                 self.ir_data = json.load(f)
 
         # Handle both old format (list) and new format (dict with metadata)
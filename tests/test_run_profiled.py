@@ -0,0 +1,81 @@
+# SPDX-FileCopyrightText: (c) 2025 Tenstorrent AI ULC
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for the background parse in run_profiled.
+"""
+
+import json
+import multiprocessing
+import os
+
+import pytest
+
+from memory_profiler import ir_parser
+from memory_profiler.run_profiled import BackgroundParse, get_output_paths
+
+_OP_LINE = (
+    'RuntimeTTNN Executing operation: %{i} = "ttnn.add"(%arg0, %arg1) : '
+    "(tensor<32x32xbf16>, tensor<32x32xbf16>) -> tensor<32x32xbf16> "
+    'loc("add.{i}")\n'
+)
+_MEMORY_LINES = (
+    "   Always |     INFO | Device memory state before operation AddOp\n"
+    "   Always |     INFO | Device DRAM memory state: MemoryView{{numBanks: 12, "
+    "totalBytesPerBank: 1024.000 MB, totalBytesAllocatedPerBank: {mb:.3f} MB}}\n"
+)
+
+
+def _write_log(path, num_ops):
+    """Write a log with num_ops operations and TTIR/TTNN modules locating them."""
+    with open(path, "w", encoding="utf-8") as f:
+        for module_type in ("ttir", "ttnn"):
+            f.write(f"2026-01-01 00:00:00.000 INFO MLIR Module {module_type}:\n")
+            f.write("module {\n")
+            for i in range(num_ops):
+                f.write(f'  %{i} = "{module_type}.add"(%arg0, %arg1) loc(#loc{i})\n')
+            f.write("}\n")
+            for i in range(num_ops):
+                f.write(f'#loc{i} = loc("add.{i}")\n')
+            f.write("END OF MLIR MODULE\n")
+        for i in range(num_ops):
+            f.write(_OP_LINE.format(i=i))
+            f.write(_MEMORY_LINES.format(mb=1.0 + i))
+
+
+@pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork",
+    reason="patched thresholds only reach the child when it is forked",
+)
+def test_background_parse_indexes_ir_in_parallel(tmp_path, monkeypatch, capsys):
+    # Take the parallel IR indexing path inside the background parse
+    monkeypatch.setattr(ir_parser, "_PARALLEL_INDEX_MIN_CHARS", 1)
+    monkeypatch.setattr(os, "cpu_count", lambda: 8)
+
+    num_ops = 50
+    _write_log(tmp_path / "model_profile.log", num_ops)
+
+    background_parse = BackgroundParse(tmp_path / "model_profile.log", tmp_path, "model")
+    assert not background_parse._process.daemon
+    assert background_parse.finish()
+    assert not background_parse._process.is_alive()
+
+    captured = capsys.readouterr()
+    assert "Error writing IR output" not in captured.err
+    assert "Parallel IR indexing unavailable" not in captured.err
+    assert "Validation passed: 50 operations properly aligned" in background_parse.validation_output[0]
+
+    _, _, _, ir_json = get_output_paths(tmp_path, "model")
+    with open(ir_json, encoding="utf-8") as f:
+        ir_data = json.load(f)
+    for module_type in ("ttir", "ttnn"):
+        loc_index = ir_data[module_type]["loc_index"]
+        assert len(loc_index) == num_ops
+        assert loc_index["add.0"] == 2
+
+
+def test_background_parse_cancel(tmp_path):
+    background_parse = BackgroundParse(tmp_path / "model_profile.log", tmp_path, "model")
+    background_parse.cancel()
+    assert not background_parse._process.is_alive()